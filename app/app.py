@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
+import io
+import sqlite3
 import sys
 
 import pandas as pd
@@ -18,6 +20,9 @@ from explainability import highlight_tokens
 from model import SentimentEmotionModel
 from preprocessing import ensure_nltk_resources, preprocess_text
 from batch_analysis import BatchAnalyzer
+from inference import BatchPredictor
+from prediction_cache import PredictionCache, model_fingerprint
+from config import BATCH_SIZE
 
 st.set_page_config(
     page_title="Intelligent Customer Emotion Analysis", 
@@ -27,49 +32,157 @@ st.set_page_config(
 )
 
 MODEL_DIR = Path(__file__).resolve().parent.parent / "models" / "saved_model"
+CACHE_PATH = MODEL_DIR.parent / "prediction_cache.sqlite"
+READ_CHUNK_SIZE = 1024  # Rows read from an uploaded file per inference batch
+
+
+@st.cache_resource(show_spinner=False)
+def _ensure_nltk() -> bool:
+    """Check NLTK resources once per process instead of on every rerun."""
+    ensure_nltk_resources()
+    return True
 
 
 @st.cache_resource(show_spinner=False)
 def load_model() -> SentimentEmotionModel | None:
     try:
-        return SentimentEmotionModel.load(MODEL_DIR)
+        model = SentimentEmotionModel.load(MODEL_DIR)
     except FileNotFoundError:
         return None
+    # Warm-up pass so the first user request doesn't pay for lazy setup
+    # (stopword corpus, regex compilation, vectorizer feature names).
+    format_prediction("Thanks, the new update works great!", model)
+    return model
 
 
-def format_prediction(text: str, model: SentimentEmotionModel) -> dict:
-    """Generate comprehensive prediction with all features."""
+@st.cache_resource(show_spinner=False)
+def get_prediction_cache() -> PredictionCache | None:
+    """Open the on-disk prediction cache for the current model, if writable."""
+    try:
+        return PredictionCache(CACHE_PATH, namespace=model_fingerprint(MODEL_DIR))
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def predict_core(
+    text: str, model: SentimentEmotionModel, cache: Optional[PredictionCache] = None
+) -> dict:
+    """Sentiment, emotion, sarcasm and business insight for a single text."""
     cleaned = preprocess_text(text)
     
-    # Use the enhanced prediction method
-    result = model.predict_with_details(cleaned)
+    # Reuse a stored prediction when this text was analyzed before
+    result = cache.get(cleaned) if cache is not None else None
+    if result is None:
+        # Use the enhanced prediction method
+        result = model.predict_with_details(cleaned)
+        if cache is not None:
+            cache.put(cleaned, result)
     
     # Add original text and cleaned text
     result["text"] = text
     result["clean_text"] = cleaned
+    return result
+
+
+def add_explanations(result: dict, model: SentimentEmotionModel) -> dict:
+    """Attach token highlights for visualization (computed on demand)."""
+    result["sentiment_tokens"] = model.explain(result["clean_text"], task="sentiment", top_n=6)
+    result["emotion_tokens"] = model.explain(result["clean_text"], task="emotion", top_n=6)
+    return result
+
+
+def format_prediction(
+    text: str, model: SentimentEmotionModel, cache: Optional[PredictionCache] = None
+) -> dict:
+    """Generate comprehensive prediction with all features."""
+    return add_explanations(predict_core(text, model, cache), model)
+
+
+def render_token_highlights(result: dict) -> None:
+    """Show sentiment and emotion token highlights side by side."""
+    col_sent, col_emo = st.columns(2)
     
-    # Get token highlights for visualization
-    result["sentiment_tokens"] = model.explain(cleaned, task="sentiment", top_n=6)
-    result["emotion_tokens"] = model.explain(cleaned, task="emotion", top_n=6)
+    with col_sent:
+        st.markdown("**🎯 Sentiment Indicators**")
+        st.markdown(
+            highlight_tokens(result["clean_text"], result["sentiment_tokens"]),
+            unsafe_allow_html=True,
+        )
     
-    return result
+    with col_emo:
+        st.markdown("**😊 Emotion Indicators**")
+        st.markdown(
+            highlight_tokens(result["clean_text"], result["emotion_tokens"]),
+            unsafe_allow_html=True,
+        )
 
 
-def analyze_file(file, model: SentimentEmotionModel) -> pd.DataFrame:
-    if file.name.lower().endswith(".csv"):
-        df = pd.read_csv(file)
-        if "text" not in df.columns:
-            raise ValueError("CSV must have a 'text' column.")
-        texts = df["text"].astype(str).tolist()
-    elif file.name.lower().endswith(".txt"):
-        texts = [line.decode("utf-8").strip() for line in file if line.strip()]
+def _iter_text_batches(file, filename: str) -> Iterator[List[str]]:
+    """Yield feedback texts from an uploaded .csv/.txt file in fixed-size batches."""
+    if filename.lower().endswith(".csv"):
+        reader = pd.read_csv(
+            file,
+            chunksize=READ_CHUNK_SIZE,
+            usecols=lambda column: column == "text",
+            dtype={"text": str},
+        )
+        for chunk in reader:
+            if "text" not in chunk.columns:
+                raise ValueError("CSV must have a 'text' column.")
+            yield chunk["text"].astype(str).tolist()
+    elif filename.lower().endswith(".txt"):
+        # One decode + C-level splitlines instead of decoding line by line
+        data = file.read().decode("utf-8", errors="replace")
+        texts = [line.strip() for line in data.splitlines() if line.strip()]
+        for start in range(0, len(texts), READ_CHUNK_SIZE):
+            yield texts[start:start + READ_CHUNK_SIZE]
     else:
         raise ValueError("Unsupported file format. Use .txt or .csv")
 
-    results = [format_prediction(text, model) for text in texts]
+
+def analyze_file(
+    file, filename: str, model: SentimentEmotionModel, cache: Optional[PredictionCache] = None
+) -> pd.DataFrame:
+    size = max(file.getbuffer().nbytes, 1)
+    progress = st.progress(0.0, text="Analyzing feedback...")
+    results = []
+    # Stream the upload so memory stays bounded and predictions start early.
+    # The predictor handles each distinct text once; token highlights are added on demand.
+    predictor = BatchPredictor(model, batch_size=BATCH_SIZE, cache=cache)
+    for texts, cleaned, predictions in predictor.run(_iter_text_batches(file, filename)):
+        for text, clean, prediction in zip(texts, cleaned, predictions):
+            result = dict(prediction)
+            result["text"] = text
+            result["clean_text"] = clean
+            results.append(result)
+        progress.progress(
+            min(file.tell() / size, 1.0),
+            text=f"Analyzed {len(results)} entries...",
+        )
+    progress.empty()
     return pd.DataFrame(results)
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def analyze_uploaded(file_bytes: bytes, filename: str) -> Tuple[pd.DataFrame, Dict, Dict]:
+    """
+    Predictions, summary report and filtered views for one uploaded file.
+
+    Cached on the file contents, so widget interactions that rerun the script
+    (row selection, explanations) skip inference and batch analysis entirely.
+    """
+    df_results = analyze_file(io.BytesIO(file_bytes), filename, load_model(), get_prediction_cache())
+    analyzer = BatchAnalyzer(df_results.to_dict("records"))
+    summary = analyzer.generate_summary_report()
+    views = {
+        "trend_text": analyzer.get_emotional_trend_text(summary),
+        "high_risk": analyzer.high_risk_feedback(),
+        "sarcastic": analyzer.sarcastic_feedback(),
+        "positive": analyzer.positive_opportunities(),
+    }
+    return df_results, summary, views
+
+
 def main() -> None:
     # Header
     st.title("🧠 Intelligent Customer Emotion Analysis")
@@ -104,13 +217,14 @@ def main() -> None:
         **Neutral/Cognitive**: Neutral, Curiosity, Surprise
         """)
 
-    ensure_nltk_resources()
+    _ensure_nltk()
     model = load_model()
 
     if model is None:
         st.warning("⚠️ No trained model found. Run the training pipeline before using the app.")
         st.code("python src/train.py", language="bash")
         st.stop()
+    cache = get_prediction_cache()
 
     tab_text, tab_file = st.tabs(["📝 Single Analysis", "📊 Batch Analysis"])
 
@@ -124,7 +238,7 @@ def main() -> None:
         
         if st.button("🔍 Analyze", type="primary", use_container_width=True) and user_text.strip():
             with st.spinner("Analyzing emotions..."):
-                result = format_prediction(user_text.strip(), model)
+                result = format_prediction(user_text.strip(), model, cache)
             
             # Main metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -186,21 +300,7 @@ def main() -> None:
             st.divider()
             
             # Token highlights
-            col_sent, col_emo = st.columns(2)
-            
-            with col_sent:
-                st.markdown("**🎯 Sentiment Indicators**")
-                st.markdown(
-                    highlight_tokens(result["clean_text"], result["sentiment_tokens"]),
-                    unsafe_allow_html=True,
-                )
-            
-            with col_emo:
-                st.markdown("**😊 Emotion Indicators**")
-                st.markdown(
-                    highlight_tokens(result["clean_text"], result["emotion_tokens"]),
-                    unsafe_allow_html=True,
-                )
+            render_token_highlights(result)
 
     with tab_file:
         st.subheader("Batch Analysis with Emotion Trends")
@@ -216,18 +316,13 @@ def main() -> None:
         if uploaded:
             try:
                 with st.spinner("Processing batch..."):
-                    df_results = analyze_file(uploaded, model)
-                
-                # Generate batch analysis
-                predictions = df_results.to_dict('records')
-                analyzer = BatchAnalyzer(predictions)
-                summary = analyzer.generate_summary_report()
+                    df_results, summary, views = analyze_uploaded(uploaded.getvalue(), uploaded.name)
                 
                 # Display summary
                 st.success(f"✅ Analyzed {summary['total_feedback']} feedback entries")
                 
                 # Trend summary
-                st.markdown(analyzer.get_emotional_trend_text())
+                st.markdown(views["trend_text"])
                 
                 st.divider()
                 
@@ -264,23 +359,22 @@ def main() -> None:
                     
                     with col_s2:
                         # Show sarcastic feedback count
-                        sarcastic_df = analyzer.sarcastic_feedback()
                         st.metric(
                             "High-Confidence Sarcasm",
-                            len(sarcastic_df),
+                            len(views["sarcastic"]),
                             "items detected"
                         )
                 
                 st.divider()
                 
                 # High risk feedback
-                high_risk = analyzer.high_risk_feedback()
+                high_risk = views["high_risk"]
                 if len(high_risk) > 0:
                     st.subheader("🚨 High-Risk Feedback (Requires Immediate Attention)")
                     st.dataframe(high_risk, use_container_width=True)
                 
                 # Sarcastic feedback section
-                sarcastic_df = analyzer.sarcastic_feedback()
+                sarcastic_df = views["sarcastic"]
                 if len(sarcastic_df) > 0:
                     st.subheader("🎭 Sarcastic Feedback (Ironic Language Detected)")
                     st.markdown(
@@ -290,7 +384,7 @@ def main() -> None:
                     st.dataframe(sarcastic_df, use_container_width=True)
                 
                 # Positive opportunities
-                positive = analyzer.positive_opportunities()
+                positive = views["positive"]
                 if len(positive) > 0:
                     st.subheader("✨ Positive Opportunities (Leverage for Growth)")
                     st.dataframe(positive, use_container_width=True)
@@ -304,6 +398,22 @@ def main() -> None:
                         "emotion", "emotion_confidence", "emotion_intensity", "is_mixed_emotion"
                     ]
                     st.dataframe(df_results[display_cols], use_container_width=True)
+                    
+                    # Token highlights are computed lazily for the selected row only
+                    # A bounded number input keeps the widget payload constant,
+                    # unlike a selectbox with one label per uploaded row
+                    row_pos = int(st.number_input(
+                        "Row to explain",
+                        min_value=0,
+                        max_value=max(len(df_results) - 1, 0),
+                        value=0,
+                        step=1,
+                    ))
+                    st.caption(f"{row_pos}: {str(df_results['text'].iat[row_pos])[:80]}")
+                    if st.button("💡 Explain this row"):
+                        row = add_explanations(df_results.iloc[row_pos].to_dict(), model)
+                        st.info(row["explanation"])
+                        render_token_highlights(row)
                 
                 # Download
                 st.download_button(
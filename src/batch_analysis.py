@@ -1,10 +1,23 @@
 """Batch analysis utilities for multiple feedback entries."""
-from typing import List, Dict
+from functools import cached_property
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
-from collections import Counter
 import numpy as np
 
-from .config import get_emotion_group, EMOTION_GROUPS
+from .config import get_emotion_group, PRIORITY_LEVELS, BUSINESS_CATEGORIES
+
+HIGH_RISK_EMOTIONS = ("anger", "frustration", "disappointment", "regret")
+POSITIVE_OPPORTUNITY_EMOTIONS = ("joy", "satisfaction", "gratitude", "trust", "excitement")
+
+# Columns returned by the feedback filters
+_FEEDBACK_COLUMNS = ["text", "emotion", "emotion_confidence", "sentiment"]
+
+# Per-row fields kept as plain numpy arrays alongside the lazy DataFrame
+_COLUMNAR_FIELDS = (
+    "sentiment", "emotion", "sentiment_confidence", "emotion_confidence",
+    "is_mixed_emotion", "sarcasm_detected", "sarcasm_confidence",
+)
+_BOOL_FIELDS = ("is_mixed_emotion", "sarcasm_detected")
 
 
 class BatchAnalyzer:
@@ -18,19 +31,108 @@ class BatchAnalyzer:
             predictions: List of dicts from model.predict_with_details()
         """
         self.predictions = predictions
-        self.df = pd.DataFrame(predictions)
-    
+        self.n = len(predictions)
+
+        # Single-column metrics read these arrays and never need the DataFrame
+        self.cols: Dict[str, np.ndarray] = {}
+        if predictions:
+            keys = predictions[0].keys()
+            self.cols = {
+                key: np.array([p[key] for p in predictions])
+                for key in _COLUMNAR_FIELDS if key in keys
+            }
+            # Flags as np.bool_ so counts are a vectorized count_nonzero
+            for key in _BOOL_FIELDS:
+                if key in self.cols:
+                    self.cols[key] = self.cols[key].astype(np.bool_)
+
+        self._summary_cache: Optional[Dict] = None
+        self._mask_cache: Dict[Tuple[float, float], Dict[str, np.ndarray]] = {}
+
+    def _compute_masks(self, threshold: float = 0.75, sarcasm_threshold: float = 0.5) -> Dict[str, np.ndarray]:
+        """
+        Row masks for the high-risk, positive and sarcastic filters, built together.
+
+        Computed from the numpy columns in one pass and cached per threshold pair,
+        so the summary report and the filter views share the same masks.
+        """
+        key = (threshold, sarcasm_threshold)
+        if key not in self._mask_cache:
+            if "emotion" in self.cols:
+                confident = self.cols["emotion_confidence"] > threshold
+                high_risk = confident & np.isin(self.cols["emotion"], HIGH_RISK_EMOTIONS)
+                positive = confident & np.isin(self.cols["emotion"], POSITIVE_OPPORTUNITY_EMOTIONS)
+            else:
+                high_risk = positive = np.zeros(self.n, dtype=bool)
+            if "sarcasm_detected" in self.cols:
+                sarcastic = self.cols["sarcasm_detected"] & (
+                    self.cols["sarcasm_confidence"] >= sarcasm_threshold
+                )
+            else:
+                sarcastic = np.zeros(self.n, dtype=bool)
+            self._mask_cache[key] = {
+                "high_risk": high_risk,
+                "positive": positive,
+                "sarcastic": sarcastic,
+            }
+        return self._mask_cache[key]
+
+    @cached_property
+    def df(self) -> pd.DataFrame:
+        """Full prediction table, built on first use by the multi-column methods."""
+        df = pd.DataFrame(self.predictions)
+
+        # Arrow-backed strings store text contiguously instead of one Python object per cell
+        if "text" in df.columns:
+            df["text"] = df["text"].astype(pd.StringDtype("pyarrow"))
+        if "sentiment" in df.columns:
+            df["sentiment"] = df["sentiment"].astype("category")
+
+        # Flatten business insights and emotion groups once for vectorized counts
+        if "business_insight" in df.columns:
+            insights = pd.DataFrame(
+                [insight if isinstance(insight, dict) else {} for insight in df["business_insight"]],
+                index=df.index,
+                columns=["priority", "category"],
+            )
+        else:
+            insights = pd.DataFrame(index=df.index, columns=["priority", "category"])
+        # Ordered categoricals: counts become a bincount over codes, and
+        # sort_values("priority") puts Critical first without a key function
+        df["priority"] = insights["priority"].astype(
+            pd.CategoricalDtype(categories=PRIORITY_LEVELS, ordered=True)
+        ).fillna("Unknown")
+        df["category"] = insights["category"].astype(
+            pd.CategoricalDtype(categories=BUSINESS_CATEGORIES, ordered=True)
+        ).fillna("Unknown")
+        if "emotion" in df.columns:
+            # Categorical codes make isin/value_counts compare small ints, not strings
+            df["emotion"] = df["emotion"].astype("category")
+            # Mapping a categorical only visits its categories, not every row. Stored
+            # as plain strings so value_counts breaks ties by first appearance
+            df["emotion_group"] = df["emotion"].map(get_emotion_group).astype(object)
+        return df
+
+    # Distributions count the raw string arrays, not the categorical DataFrame
+    # columns: on categoricals value_counts breaks ties alphabetically instead
+    # of by first appearance, which would reorder the report on tied counts
+    @cached_property
+    def _sentiment_pct(self) -> pd.Series:
+        """Sentiment shares in percent, sorted descending (computed once)."""
+        return pd.Series(self.cols["sentiment"]).value_counts(normalize=True) * 100
+
+    @cached_property
+    def _emotion_pct(self) -> pd.Series:
+        """Emotion shares in percent, sorted descending (computed once)."""
+        return pd.Series(self.cols["emotion"]).value_counts(normalize=True) * 100
+
     def sentiment_distribution(self) -> Dict[str, float]:
         """Get sentiment distribution as percentages."""
-        counts = self.df["sentiment"].value_counts()
-        total = len(self.df)
-        return {k: (v / total * 100) for k, v in counts.items()}
+        return self._sentiment_pct.to_dict()
     
     def emotion_distribution(self) -> Dict[str, float]:
         """Get emotion distribution as percentages."""
-        counts = self.df["emotion"].value_counts()
-        total = len(self.df)
-        return {k: (v / total * 100) for k, v in counts.items()}
+        return self._emotion_pct.to_dict()
     
     def dominant_emotion(self) -> str:
         """Get the most frequent emotion."""
@@ -39,8 +141,8 @@ class BatchAnalyzer:
     def average_confidence(self) -> Dict[str, float]:
         """Get average confidence scores."""
         return {
-            "sentiment": float(self.df["sentiment_confidence"].mean()),
-            "emotion": float(self.df["emotion_confidence"].mean()),
+            "sentiment": float(self.cols["sentiment_confidence"].mean()) if self.n else float("nan"),
+            "emotion": float(self.cols["emotion_confidence"].mean()) if self.n else float("nan"),
         }
     
     def intensity_breakdown(self) -> Dict[str, Dict[str, int]]:
@@ -52,22 +154,21 @@ class BatchAnalyzer:
     
     def emotion_group_distribution(self) -> Dict[str, float]:
         """Get distribution across emotion groups (positive/negative/neutral)."""
-        self.df["emotion_group"] = self.df["emotion"].apply(get_emotion_group)
         counts = self.df["emotion_group"].value_counts()
         total = len(self.df)
         return {k: (v / total * 100) for k, v in counts.items()}
     
     def mixed_emotion_rate(self) -> float:
         """Get percentage of feedback with mixed emotions."""
-        mixed_count = self.df["is_mixed_emotion"].sum()
-        return (mixed_count / len(self.df) * 100) if len(self.df) > 0 else 0.0
+        if self.n == 0:
+            return 0.0
+        return np.count_nonzero(self.cols["is_mixed_emotion"]) / self.n * 100
     
     def sarcasm_rate(self) -> float:
         """Get percentage of feedback with detected sarcasm."""
-        if "sarcasm_detected" not in self.df.columns:
+        if "sarcasm_detected" not in self.cols:
             return 0.0
-        sarcasm_count = self.df["sarcasm_detected"].sum()
-        return (sarcasm_count / len(self.df) * 100) if len(self.df) > 0 else 0.0
+        return np.count_nonzero(self.cols["sarcasm_detected"]) / self.n * 100
     
     def sarcastic_feedback(self, threshold: float = 0.5) -> pd.DataFrame:
         """
@@ -79,16 +180,12 @@ class BatchAnalyzer:
         Returns:
             DataFrame with sarcastic feedback
         """
-        if "sarcasm_detected" not in self.df.columns:
+        if "sarcasm_detected" not in self.cols:
             return pd.DataFrame()
         
-        sarcastic = self.df[
-            (self.df["sarcasm_detected"] == True) &
-            (self.df["sarcasm_confidence"] >= threshold)
-        ].copy()
-        
-        if len(sarcastic) > 0:
-            return sarcastic[["text", "emotion", "sentiment", "sarcasm_confidence"]]
+        mask = self._compute_masks(sarcasm_threshold=threshold)["sarcastic"]
+        if np.count_nonzero(mask):
+            return self.df.loc[mask, ["text", "emotion", "sentiment", "sarcasm_confidence"]]
         return pd.DataFrame()
     
     def sarcasm_sentiment_correlation(self) -> Dict[str, float]:
@@ -96,32 +193,29 @@ class BatchAnalyzer:
         Analyze correlation between sarcasm and sentiment.
         Returns percentage of sarcastic feedback in each sentiment category.
         """
-        if "sarcasm_detected" not in self.df.columns:
+        if "sarcasm_detected" not in self.cols:
             return {}
         
+        sarcastic = self.cols["sarcasm_detected"]
         correlation = {}
         for sentiment in ["positive", "negative", "neutral"]:
-            sentiment_df = self.df[self.df["sentiment"] == sentiment]
-            if len(sentiment_df) > 0:
-                sarcasm_in_sentiment = sentiment_df["sarcasm_detected"].sum()
-                pct = (sarcasm_in_sentiment / len(sentiment_df)) * 100
-                correlation[sentiment] = pct
+            in_sentiment = self.cols["sentiment"] == sentiment
+            sentiment_count = np.count_nonzero(in_sentiment)
+            if sentiment_count > 0:
+                sarcasm_in_sentiment = np.count_nonzero(sarcastic & in_sentiment)
+                correlation[sentiment] = (sarcasm_in_sentiment / sentiment_count) * 100
             else:
                 correlation[sentiment] = 0.0
         
         return correlation
     
     def priority_breakdown(self) -> Dict[str, int]:
-        """Get count of feedback by business priority level."""
-        priorities = [pred.get("business_insight", {}).get("priority", "Unknown") 
-                     for pred in self.predictions]
-        return dict(Counter(priorities))
+        """Get count of feedback by business priority level (most urgent first)."""
+        return _category_counts(self.df["priority"])
     
     def category_breakdown(self) -> Dict[str, int]:
         """Get count of feedback by business category."""
-        categories = [pred.get("business_insight", {}).get("category", "Unknown") 
-                     for pred in self.predictions]
-        return dict(Counter(categories))
+        return _category_counts(self.df["category"])
     
     def high_risk_feedback(self, threshold: float = 0.75) -> pd.DataFrame:
         """
@@ -132,12 +226,8 @@ class BatchAnalyzer:
         - High confidence (> threshold)
         - Critical or High priority
         """
-        high_risk = self.df[
-            (self.df["emotion"].isin(["anger", "frustration", "disappointment", "regret"])) &
-            (self.df["emotion_confidence"] > threshold)
-        ].copy()
-        
-        return high_risk[["text", "emotion", "emotion_confidence", "sentiment"]] if len(high_risk) > 0 else pd.DataFrame()
+        mask = self._compute_masks(threshold)["high_risk"]
+        return self.df.loc[mask, _FEEDBACK_COLUMNS] if mask.any() else pd.DataFrame()
     
     def positive_opportunities(self, threshold: float = 0.75) -> pd.DataFrame:
         """
@@ -147,28 +237,27 @@ class BatchAnalyzer:
         - Positive emotions (joy, satisfaction, gratitude, trust)
         - High confidence (> threshold)
         """
-        positive = self.df[
-            (self.df["emotion"].isin(["joy", "satisfaction", "gratitude", "trust", "excitement"])) &
-            (self.df["emotion_confidence"] > threshold)
-        ].copy()
-        
-        return positive[["text", "emotion", "emotion_confidence", "sentiment"]] if len(positive) > 0 else pd.DataFrame()
+        mask = self._compute_masks(threshold)["positive"]
+        return self.df.loc[mask, _FEEDBACK_COLUMNS] if mask.any() else pd.DataFrame()
     
     def generate_summary_report(self) -> Dict:
-        """Generate a comprehensive summary report."""
+        """Generate a comprehensive summary report (cached after the first call)."""
+        if self._summary_cache is not None:
+            return self._summary_cache
+
         total = len(self.df)
         
-        # Overall sentiment
+        # Overall sentiment (value_counts is already sorted descending)
         sentiment_dist = self.sentiment_distribution()
-        dominant_sentiment = max(sentiment_dist.items(), key=lambda x: x[1])[0] if sentiment_dist else "unknown"
+        dominant_sentiment = self._sentiment_pct.idxmax() if sentiment_dist else "unknown"
         
         # Emotion insights
-        emotion_dist = self.emotion_distribution()
-        top_3_emotions = sorted(emotion_dist.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_3_emotions = self._emotion_pct.head(3).to_dict()
         
-        # Risk assessment
-        high_risk_count = len(self.high_risk_feedback())
-        positive_opp_count = len(self.positive_opportunities())
+        # Risk assessment (counts only; no filtered DataFrames are built)
+        masks = self._compute_masks()
+        high_risk_count = np.count_nonzero(masks["high_risk"])
+        positive_opp_count = np.count_nonzero(masks["positive"])
         
         # Confidence metrics
         avg_conf = self.average_confidence()
@@ -182,11 +271,11 @@ class BatchAnalyzer:
         sarcasm_pct = self.sarcasm_rate()
         sarcasm_correlation = self.sarcasm_sentiment_correlation()
         
-        return {
+        self._summary_cache = {
             "total_feedback": total,
             "dominant_sentiment": dominant_sentiment,
             "sentiment_breakdown": sentiment_dist,
-            "top_3_emotions": {k: v for k, v in top_3_emotions},
+            "top_3_emotions": top_3_emotions,
             "emotion_group_distribution": self.emotion_group_distribution(),
             "mixed_emotion_rate": self.mixed_emotion_rate(),
             "sarcasm_rate": sarcasm_pct,
@@ -198,10 +287,17 @@ class BatchAnalyzer:
             "priority_breakdown": priority_counts,
             "category_breakdown": self.category_breakdown(),
         }
+        return self._summary_cache
     
-    def get_emotional_trend_text(self) -> str:
-        """Generate a text summary of emotional trends."""
-        summary = self.generate_summary_report()
+    def get_emotional_trend_text(self, summary: Optional[Dict] = None) -> str:
+        """
+        Generate a text summary of emotional trends.
+        
+        Args:
+            summary: Report from generate_summary_report(), reused if already built
+        """
+        if summary is None:
+            summary = self.generate_summary_report()
         
         lines = [
             f"📊 **Batch Analysis Summary** ({summary['total_feedback']} feedbacks)",
@@ -240,3 +336,10 @@ class BatchAnalyzer:
         lines.append(f"  - 🚨 Urgent Attention: {summary['urgent_attention_needed']} items")
         
         return "\n".join(lines)
+
+
+def _category_counts(column: pd.Series) -> Dict[str, int]:
+    """Count a categorical column with one bincount over its codes, skipping empty levels."""
+    categories = column.cat.categories
+    counts = np.bincount(column.cat.codes.to_numpy(), minlength=len(categories))
+    return {category: int(count) for category, count in zip(categories, counts) if count}
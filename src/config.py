@@ -1,6 +1,11 @@
 """Configuration for emotion taxonomy and business insights."""
+import re
+from bisect import bisect_right
+from types import MappingProxyType
 from typing import Dict, List, Tuple
 
+import ahocorasick
+
 # ========================================
 # EMOTION TAXONOMY (18 classes)
 # ========================================
@@ -38,6 +43,11 @@ ALL_EMOTIONS = (
     + EMOTION_GROUPS["neutral_cognitive"]
 )
 
+# Read-only reverse lookup (emotion -> group) built once at import
+EMOTION_TO_GROUP = MappingProxyType(
+    {emotion: group for group, emotions in EMOTION_GROUPS.items() for emotion in emotions}
+)
+
 # ========================================
 # SENTIMENT LABELS (3 classes)
 # ========================================
@@ -54,18 +64,31 @@ INTENSITY_THRESHOLDS = {
     "high": (0.75, 1.0),
 }
 
+# Bin edges for get_intensity: level i covers [_INTENSITY_EDGES[i-1], _INTENSITY_EDGES[i])
+_INTENSITY_LEVELS = sorted(INTENSITY_THRESHOLDS, key=lambda level: INTENSITY_THRESHOLDS[level][0])
+_INTENSITY_EDGES = [INTENSITY_THRESHOLDS[level][0] for level in _INTENSITY_LEVELS[1:]]
+_INTENSITY_FLOOR = INTENSITY_THRESHOLDS[_INTENSITY_LEVELS[0]][0]
+
 # ========================================
 # MIXED EMOTION THRESHOLD
 # ========================================
 
 MIXED_EMOTION_THRESHOLD = 0.15  # If top-2 emotions differ by less than this, flag as mixed
 
+# ========================================
+# BATCH INFERENCE
+# ========================================
+
+BATCH_SIZE = 64  # Texts per vectorized classifier pass in batch prediction
+PARALLEL_PREDICT_MIN_TEXTS = 5000  # Run sentiment/emotion pipelines in parallel threads above this size
+
 # ========================================
 # SARCASM DETECTION THRESHOLDS
 # ========================================
 
 SARCASM_CONFIDENCE_THRESHOLD = 0.5  # Minimum confidence to flag as sarcastic
 SARCASM_HIGH_CONFIDENCE = 0.7  # High confidence sarcasm threshold
+MIN_SARCASM_LEN = 8  # Shorter texts are never flagged as sarcastic
 
 # Emotions prioritized when sarcasm is detected
 SARCASM_PRIORITY_EMOTIONS = [
@@ -75,6 +98,55 @@ SARCASM_PRIORITY_EMOTIONS = [
     "disappointment",
 ]
 
+# ========================================
+# SARCASM CUES
+# ========================================
+
+# Known sarcastic phrases and expressions (literal text, matched as whole words)
+SARCASTIC_PHRASES = [
+    r"great job",
+    r"well done",
+    r"thanks a lot",
+    r"oh wonderful",
+    r"oh great",
+    r"just wonderful",
+    r"just perfect",
+    r"brilliant idea",
+    r"genius",
+    r"fantastic",
+    r"amazing work",
+    r"real smart",
+    r"very helpful",
+    r"so helpful",
+    r"love it when",
+    r"really appreciate",
+    r"couldn't be better",
+]
+
+# Negative context indicators (words that suggest complaint/problem)
+SARCASM_NEGATIVE_CONTEXT = [
+    "terrible", "awful", "horrible", "worst", "useless", "broken", "failed",
+    "disaster", "nightmare", "unacceptable", "ridiculous", "pathetic",
+    "waste", "never", "disappointed", "frustrated", "angry", "furious",
+    "can't believe", "seriously", "joke", "kidding"
+]
+
+# Positive surface words (might be used sarcastically)
+SARCASM_POSITIVE_SURFACE = [
+    "great", "wonderful", "excellent", "perfect", "amazing", "fantastic",
+    "brilliant", "awesome", "outstanding", "superb", "lovely", "nice",
+    "thanks", "thank", "appreciate", "love", "enjoy"
+]
+
+# Intensifiers that might indicate sarcasm when combined with positive words
+SARCASTIC_INTENSIFIERS = [
+    "really", "so", "very", "such", "totally", "absolutely", "definitely",
+    "surely", "clearly", "obviously", "just"
+]
+
+# Distinct (text, sentiment, emotion) results kept per detector instance
+SARCASM_CACHE_SIZE = 4096
+
 # ========================================
 # BUSINESS INSIGHT MAPPING
 # ========================================
@@ -175,6 +247,14 @@ BUSINESS_INSIGHTS: Dict[str, Dict[str, str]] = {
     },
 }
 
+# Business priority levels, most urgent first ("Unknown" when no insight is available)
+PRIORITY_LEVELS = ["Critical", "High", "Medium", "Low", "Unknown"]
+
+# Business categories in mapping order ("Unknown" when no insight is available)
+BUSINESS_CATEGORIES = list(
+    dict.fromkeys(insight["category"] for insight in BUSINESS_INSIGHTS.values())
+) + ["Unknown"]
+
 # ========================================
 # EMOTION KEYWORDS (for explanation generation)
 # ========================================
@@ -254,16 +334,66 @@ EMOTION_KEYWORDS: Dict[str, List[str]] = {
     ],
 }
 
+# Read-only reverse lookup (keyword -> emotions) built once at import. Some
+# keywords belong to several emotions ("wow", "worried", "pleased"), so each
+# value is a tuple in EMOTION_KEYWORDS order.
+KEYWORD_TO_EMOTION = MappingProxyType({
+    keyword: tuple(emotion for emotion, words in EMOTION_KEYWORDS.items() if keyword in words)
+    for keywords in EMOTION_KEYWORDS.values()
+    for keyword in keywords
+})
+
+# ========================================
+# KEYWORD SCANNING
+# ========================================
+
+# Scan labels for the sarcasm cue lists; emotion keywords are labelled by emotion
+POSITIVE_SURFACE_LABEL = "positive_surface"
+NEGATIVE_CONTEXT_LABEL = "negative_context"
+INTENSIFIER_LABEL = "intensifier"
+SARCASTIC_PHRASE_LABEL = "sarcastic_phrase"
+
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """
+    One Aho-Corasick automaton over all emotion keywords, sarcasm cue words
+    and sarcastic phrases.
+
+    The automaton is a character trie with failure links, so multi-word phrases
+    ("meets expectations", "out of nowhere") and keywords inside longer words are
+    found in one pass over the text, however large the keyword lists grow.
+    """
+    labels: Dict[str, List[str]] = {
+        keyword: list(emotions) for keyword, emotions in KEYWORD_TO_EMOTION.items()
+    }
+    for word in SARCASM_POSITIVE_SURFACE:
+        labels.setdefault(word, []).append(POSITIVE_SURFACE_LABEL)
+    for word in SARCASM_NEGATIVE_CONTEXT:
+        labels.setdefault(word, []).append(NEGATIVE_CONTEXT_LABEL)
+    for word in SARCASTIC_INTENSIFIERS:
+        labels.setdefault(word, []).append(INTENSIFIER_LABEL)
+    for phrase in SARCASTIC_PHRASES:
+        labels.setdefault(phrase, []).append(SARCASTIC_PHRASE_LABEL)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_labels in labels.items():
+        automaton.add_word(keyword, (keyword, tuple(keyword_labels)))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+_WORD_CHAR = re.compile(r"\w")
+
 # ========================================
 # HELPER FUNCTIONS
 # ========================================
 
 def get_intensity(confidence: float) -> str:
     """Map confidence score to intensity level."""
-    for level, (low, high) in INTENSITY_THRESHOLDS.items():
-        if low <= confidence < high:
-            return level
-    return "high"
+    if not confidence >= _INTENSITY_FLOOR:  # Below range or NaN
+        return "high"
+    return _INTENSITY_LEVELS[bisect_right(_INTENSITY_EDGES, confidence)]
 
 
 def get_business_insight(emotion: str) -> Dict[str, str]:
@@ -277,8 +407,49 @@ def get_business_insight(emotion: str) -> Dict[str, str]:
 
 def get_emotion_group(emotion: str) -> str:
     """Get the group (positive/negative/neutral_cognitive) for an emotion."""
-    emotion_lower = emotion.lower()
-    for group, emotions in EMOTION_GROUPS.items():
-        if emotion_lower in emotions:
-            return group
-    return "unknown"
+    return EMOTION_TO_GROUP.get(emotion.lower(), "unknown")
+
+
+def scan_keyword_spans(text: str, whole_words: bool = False) -> List[Tuple[int, int, str, Tuple[str, ...]]]:
+    """
+    Every keyword occurrence in ``text`` from a single automaton pass.
+
+    Args:
+        text: Lowercased text to scan
+        whole_words: Only keep hits not embedded in a longer word (like regex \\b)
+
+    Returns:
+        ``(start, end, keyword, labels)`` tuples ordered by end position, with
+        ``end`` exclusive. Labels are emotion names, POSITIVE_SURFACE_LABEL,
+        NEGATIVE_CONTEXT_LABEL, INTENSIFIER_LABEL or SARCASTIC_PHRASE_LABEL.
+    """
+    spans = []
+    for last, (keyword, labels) in _KEYWORD_AUTOMATON.iter(text):
+        start, end = last - len(keyword) + 1, last + 1
+        if whole_words and (
+            (start > 0 and _WORD_CHAR.match(text[start - 1]))
+            or (end < len(text) and _WORD_CHAR.match(text[end]))
+        ):
+            continue
+        spans.append((start, end, keyword, labels))
+    return spans
+
+
+def scan_keywords(text: str, whole_words: bool = False) -> Dict[str, List[str]]:
+    """
+    Find emotion keywords and sarcasm cues in ``text`` with a single automaton pass.
+
+    Args:
+        text: Lowercased text to scan
+        whole_words: Only count hits not embedded in a longer word (like regex \\b)
+
+    Returns:
+        Label -> distinct matched keywords in order of first occurrence
+    """
+    hits: Dict[str, List[str]] = {}
+    for _, _, keyword, labels in scan_keyword_spans(text, whole_words):
+        for label in labels:
+            found = hits.setdefault(label, [])
+            if keyword not in found:
+                found.append(keyword)
+    return hits
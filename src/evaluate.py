@@ -14,7 +14,7 @@ from sklearn.metrics import classification_report, confusion_matrix
 from .model import SentimentEmotionModel
 from .preprocessing import preprocess_series
 
-DEFAULT_TEST = Path("data/processed/test.csv")
+DEFAULT_TEST = Path("data/processed/test.parquet")
 DEFAULT_MODELS = Path("models/saved_model")
 DEFAULT_OUTPUT = Path("data/processed")
 
@@ -22,7 +22,14 @@ DEFAULT_OUTPUT = Path("data/processed")
 def load_test_data(test_path: Path) -> pd.DataFrame:
     if not test_path.exists():
         raise FileNotFoundError(f"Test split not found at {test_path}")
-    df = pd.read_csv(test_path)
+    columns = {"text", "clean_text", "sentiment", "emotion"}
+    if test_path.suffix == ".parquet":
+        # Splits written by train.py; columns keep their string types
+        df = pd.read_parquet(test_path, engine="pyarrow")
+        df = df[[column for column in df.columns if column in columns]]
+    else:
+        # Only the columns evaluation uses, read as strings with no dtype inference
+        df = pd.read_csv(test_path, usecols=lambda column: column in columns, dtype=str)
     if "clean_text" not in df.columns:
         df["clean_text"] = preprocess_series(df["text"].fillna(""))
     # Filter out any rows with NaN in clean_text
@@ -49,16 +56,11 @@ def plot_confusion_matrix(
     ax.set_title(title)
 
     thresh = matrix.max() / 2.0
-    for i in range(matrix.shape[0]):
-        for j in range(matrix.shape[1]):
-            ax.text(
-                j,
-                i,
-                format(matrix[i, j], "d"),
-                ha="center",
-                va="center",
-                color="white" if matrix[i, j] > thresh else "black",
-            )
+    # Cell colours and labels computed for the whole matrix at once
+    colors = np.where(matrix > thresh, "white", "black")
+    cell_text = matrix.astype(str)
+    for (i, j), label in np.ndenumerate(cell_text):
+        ax.text(j, i, label, ha="center", va="center", color=colors[i, j])
 
     fig.tight_layout()
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -113,7 +115,7 @@ def run(args: argparse.Namespace) -> None:
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Evaluate trained sentiment and emotion models")
-    parser.add_argument("--test", type=str, default=str(DEFAULT_TEST), help="Path to test CSV")
+    parser.add_argument("--test", type=str, default=str(DEFAULT_TEST), help="Path to test split (Parquet or CSV)")
     parser.add_argument("--models-dir", type=str, default=str(DEFAULT_MODELS), help="Directory with saved models")
     parser.add_argument(
         "--output-dir",
@@ -17,20 +17,33 @@ def _color_from_weight(weight: float) -> str:
     return f"rgba(231, 76, 60, {alpha:.2f})"  # red
 
 
+def _case_key(text: str) -> str:
+    """
+    Caseless lookup key; equal for any two strings re.IGNORECASE treats as equal.
+
+    casefold() alone keeps the Turkish dotless and dotted i apart ("ı", "i̇"),
+    which re.IGNORECASE matches against "i"/"I".
+    """
+    return text.casefold().replace("ı", "i").replace("\u0307", "")
+
+
 def highlight_tokens(text: str, token_scores: TokenScores) -> str:
     """Return HTML string with tokens (including n-grams) highlighted based on their weights."""
     tokens = [(tok, weight) for tok, weight in token_scores if tok.strip()]
     if not tokens:
         return text
 
-    # Sort longer n-grams first to avoid nested replacements breaking spans
+    # Sort longer n-grams first so the alternation prefers them at each position
     tokens = sorted(tokens, key=lambda t: len(t[0]), reverse=True)
-    highlighted = text
+    colors = {}
     for token, weight in tokens:
-        color = _color_from_weight(weight)
-        pattern = re.compile(re.escape(token), flags=re.IGNORECASE)
-        highlighted = pattern.sub(
-            lambda m: f"<span style='background-color:{color}; padding:2px 4px; border-radius:4px'>{m.group(0)}</span>",
-            highlighted,
-        )
-    return highlighted
+        colors.setdefault(_case_key(token), _color_from_weight(weight))
+    # One pass over the text: already-inserted spans are never re-scanned
+    pattern = re.compile("|".join(re.escape(token) for token, _ in tokens), flags=re.IGNORECASE)
+
+    def _wrap(match: re.Match) -> str:
+        matched = match.group(0)
+        color = colors[_case_key(matched)]
+        return f"<span style='background-color:{color}; padding:2px 4px; border-radius:4px'>{matched}</span>"
+
+    return pattern.sub(_wrap, text)
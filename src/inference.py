@@ -0,0 +1,61 @@
+"""Batched inference for feedback files."""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .config import BATCH_SIZE
+from .model import SentimentEmotionModel
+from .prediction_cache import PredictionCache
+from .preprocessing import preprocess_text
+
+
+class BatchPredictor:
+    """
+    Cleans and classifies incoming batches of feedback in order, on the calling thread.
+
+    Each distinct cleaned text is predicted only once per predictor, and not at
+    all if an optional on-disk cache already holds its prediction. Reading,
+    cleaning and predicting are deliberately not overlapped: a background
+    producer thread measured slower than this plain loop, since all three
+    stages hold the GIL for most of their time.
+    """
+
+    def __init__(
+        self,
+        model: SentimentEmotionModel,
+        batch_size: int = BATCH_SIZE,
+        cache: Optional[PredictionCache] = None,
+    ) -> None:
+        """
+        Args:
+            model: Loaded sentiment/emotion model
+            batch_size: Texts per classifier call
+            cache: Persistent prediction cache consulted before running the model
+        """
+        self.model = model
+        self.batch_size = batch_size
+        self.cache = cache
+        self._predictions: Dict[str, Dict] = {}
+
+    def run(self, batches: Iterable[List[str]]) -> Iterator[Tuple[List[str], List[str], List[Dict]]]:
+        """
+        Yield ``(texts, cleaned_texts, predictions)`` for every input batch, in order.
+
+        Prediction dicts are shared between duplicate texts; copy them before mutating.
+        """
+        for texts in batches:
+            cleaned = [preprocess_text(t) for t in texts]
+            yield texts, cleaned, self._predict(cleaned)
+
+    def _predict(self, cleaned: List[str]) -> List[Dict]:
+        """Run the model on texts not seen or cached before and return predictions in input order."""
+        pending = [text for text in dict.fromkeys(cleaned) if text not in self._predictions]
+        if pending and self.cache is not None:
+            self._predictions.update(self.cache.get_many(pending))
+            pending = [text for text in pending if text not in self._predictions]
+        if pending:
+            predicted = list(zip(pending, self.model.predict_with_details_batch(pending, batch_size=self.batch_size)))
+            self._predictions.update(predicted)
+            if self.cache is not None:
+                self.cache.put_many(predicted)
+        return [self._predictions[text] for text in cleaned]
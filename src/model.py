@@ -1,25 +1,36 @@
 """Model definitions for sentiment and emotion classification."""
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple, Optional
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Optional
 
 import joblib
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 
 from .config import (
+    BATCH_SIZE,
+    PARALLEL_PREDICT_MIN_TEXTS,
     get_intensity,
     get_business_insight,
     MIXED_EMOTION_THRESHOLD,
     EMOTION_KEYWORDS,
+    scan_keywords,
     SARCASM_PRIORITY_EMOTIONS,
 )
 from .sarcasm_detector import get_sarcasm_detector
 
 TextList = Iterable[str]
 
+# Feature names and class index per fitted pipeline. Kept beside the pipelines
+# rather than on them, so joblib.dump does not store the vocabulary twice
+_LOOKUPS: "weakref.WeakKeyDictionary[Pipeline, Tuple[np.ndarray, Dict[str, int]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def build_pipeline(max_features: int = 12000, ngram_range: Tuple[int, int] = (1, 2)) -> Pipeline:
     """Create a TF-IDF + Logistic Regression pipeline."""
@@ -32,6 +43,8 @@ def build_pipeline(max_features: int = 12000, ngram_range: Tuple[int, int] = (1,
                     ngram_range=ngram_range,
                     min_df=2,
                     strip_accents="unicode",
+                    # float32 halves the bytes moved through the sparse dot product
+                    dtype=np.float32,
                 ),
             ),
             (
@@ -51,11 +64,13 @@ class ModelArtifacts:
     sentiment_model: Pipeline
     emotion_model: Pipeline
 
-    def save(self, sentiment_path: Path, emotion_path: Path) -> None:
+    def save(self, sentiment_path: Path, emotion_path: Path, compress: int = 3) -> None:
         sentiment_path.parent.mkdir(parents=True, exist_ok=True)
         emotion_path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(self.sentiment_model, sentiment_path)
-        joblib.dump(self.emotion_model, emotion_path)
+        # zlib level 3: smaller files to read on cold start; joblib.load detects it.
+        # Memory-mapping is not used since joblib cannot mmap compressed files.
+        joblib.dump(self.sentiment_model, sentiment_path, compress=compress)
+        joblib.dump(self.emotion_model, emotion_path, compress=compress)
 
     @classmethod
     def load(cls, sentiment_path: Path, emotion_path: Path) -> "ModelArtifacts":
@@ -83,17 +98,40 @@ class SentimentEmotionModel:
     def fit(self, texts: TextList, sentiment_labels: TextList, emotion_labels: TextList) -> "SentimentEmotionModel":
         self.sentiment_model.fit(texts, sentiment_labels)
         self.emotion_model.fit(texts, emotion_labels)
+        # Refresh lookups so explanations never use a previous fit's vocabulary
+        _attach_lookups(self.sentiment_model)
+        _attach_lookups(self.emotion_model)
         return self
 
     def predict(self, texts: TextList) -> Dict[str, List[str]]:
-        sentiments = self.sentiment_model.predict(texts)
-        emotions = self.emotion_model.predict(texts)
-        return {"sentiment": sentiments, "emotion": emotions}
+        return self._run_pipelines(lambda pipeline, batch: _call_steps(pipeline, "predict", batch), texts)
 
     def predict_proba(self, texts: TextList) -> Dict[str, np.ndarray]:
-        sentiment_probs = self.sentiment_model.predict_proba(texts)
-        emotion_probs = self.emotion_model.predict_proba(texts)
-        return {"sentiment": sentiment_probs, "emotion": emotion_probs}
+        return self._run_pipelines(lambda pipeline, batch: _call_steps(pipeline, "predict_proba", batch), texts)
+
+    def predict_all(self, texts: TextList) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        Labels and probabilities for both tasks from one TF-IDF transform per task.
+
+        Labels are the argmax of the probabilities, so callers that need both
+        avoid running the vectorizer twice.
+        """
+        outputs = self._run_pipelines(_labels_and_proba, texts)
+        preds = {task: labels for task, (labels, _) in outputs.items()}
+        probs = {task: proba for task, (_, proba) in outputs.items()}
+        return preds, probs
+
+    def _run_pipelines(self, step: Callable[[Pipeline, List[str]], Any], texts: TextList) -> Dict:
+        """Apply ``step`` to both task pipelines, in two threads when the input is large."""
+        texts = list(texts)
+        pipelines = (self.sentiment_model, self.emotion_model)
+        if len(texts) >= PARALLEL_PREDICT_MIN_TEXTS:
+            outputs = Parallel(n_jobs=2, prefer="threads")(
+                delayed(step)(pipeline, texts) for pipeline in pipelines
+            )
+        else:
+            outputs = [step(pipeline, texts) for pipeline in pipelines]
+        return {"sentiment": outputs[0], "emotion": outputs[1]}
 
     def predict_with_details(self, text: str) -> Dict:
         """
@@ -115,90 +153,116 @@ class SentimentEmotionModel:
             - business_insight: actionable recommendation
             - explanation: natural language explanation
         """
-        cleaned = text
-        
-        # Get predictions
-        preds = self.predict([cleaned])
-        probs = self.predict_proba([cleaned])
-        
-        sentiment = preds["sentiment"][0]
-        emotion = preds["emotion"][0]
-        
-        # Get class lists
-        sentiment_classes = list(self.sentiment_model.named_steps["clf"].classes_)
-        emotion_classes = list(self.emotion_model.named_steps["clf"].classes_)
-        
-        # Get confidence scores
-        sentiment_conf = float(probs["sentiment"][0][sentiment_classes.index(sentiment)])
-        emotion_conf = float(probs["emotion"][0][emotion_classes.index(emotion)])
-        
-        # Get intensity levels
-        sentiment_intensity = get_intensity(sentiment_conf)
-        emotion_intensity = get_intensity(emotion_conf)
-        
-        # Detect mixed emotions
-        emotion_probs_sorted = sorted(
-            zip(emotion_classes, probs["emotion"][0]),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        primary_emotion = emotion_probs_sorted[0][0]
-        secondary_emotion = emotion_probs_sorted[1][0] if len(emotion_probs_sorted) > 1 else None
-        secondary_conf = emotion_probs_sorted[1][1] if len(emotion_probs_sorted) > 1 else 0.0
-        
-        is_mixed = False
-        if secondary_emotion and (emotion_probs_sorted[0][1] - secondary_conf) < MIXED_EMOTION_THRESHOLD:
-            is_mixed = True
-        
-        # SARCASM DETECTION
+        return self.predict_with_details_batch([text])[0]
+
+    def predict_with_details_batch(self, texts: Sequence[str], batch_size: int = BATCH_SIZE) -> List[Dict]:
+        """
+        Batched counterpart of predict_with_details for already-cleaned texts.
+
+        Texts are processed in chunks of ``batch_size``: each chunk is vectorized
+        once per task and scored in a single classifier call, so large files avoid
+        a TF-IDF transform and classifier round-trip per row.
+        """
+        texts = list(texts)
+        results: List[Dict] = []
+        for start in range(0, len(texts), batch_size):
+            results.extend(self._predict_details_chunk(texts[start:start + batch_size]))
+        return results
+
+    def _predict_details_chunk(self, texts: List[str]) -> List[Dict]:
+        sentiment_clf = self.sentiment_model.named_steps["clf"]
+        emotion_clf = self.emotion_model.named_steps["clf"]
+
+        sentiment_vectors, sentiment_probs = _transform_and_score(self.sentiment_model, texts)
+        emotion_vectors, emotion_probs = _transform_and_score(self.emotion_model, texts)
+
+        # Vectorized class selection over the whole chunk
+        rows = np.arange(len(texts))
+        sentiment_idx = sentiment_probs.argmax(axis=1)
+        emotion_order = _top_two(emotion_probs)
+        sentiment_confs = sentiment_probs[rows, sentiment_idx]
+        emotion_confs = emotion_probs[rows, emotion_order[:, 0]]
+
+        sentiment_features, _ = _lookups(self.sentiment_model)
+        emotion_features, _ = _lookups(self.emotion_model)
         sarcasm_detector = get_sarcasm_detector()
-        sarcasm_result = sarcasm_detector.detect(
-            text=cleaned,
-            sentiment=sentiment,
-            emotion=emotion
-        )
-        
-        # If sarcasm detected with high confidence, re-interpret sentiment
-        original_sentiment = sentiment
-        if sarcasm_result.is_sarcastic and sarcasm_result.confidence > 0.7:
-            # Sarcasm often flips positive to negative
-            if sentiment == "positive":
-                # Check if we should override based on emotion
-                if emotion in SARCASM_PRIORITY_EMOTIONS:
-                    sentiment = "negative"
-        
-        # Get business insight
-        insight = get_business_insight(emotion)
-        
-        # Generate natural language explanation (with sarcasm context)
-        explanation = generate_explanation(
-            text=cleaned,
-            sentiment=sentiment,
-            emotion=emotion,
-            sentiment_conf=sentiment_conf,
-            emotion_conf=emotion_conf,
-            tokens_sentiment=self.explain(cleaned, task="sentiment", top_n=3),
-            tokens_emotion=self.explain(cleaned, task="emotion", top_n=3),
-            sarcasm_result=sarcasm_result,
-            original_sentiment=original_sentiment if sentiment != original_sentiment else None,
-        )
-        
-        return {
-            "sentiment": sentiment,
-            "sentiment_confidence": sentiment_conf,
-            "sentiment_intensity": sentiment_intensity,
-            "emotion": primary_emotion,
-            "emotion_confidence": emotion_conf,
-            "emotion_intensity": emotion_intensity,
-            "secondary_emotion": secondary_emotion if is_mixed else None,
-            "secondary_confidence": float(secondary_conf) if is_mixed else None,
-            "is_mixed_emotion": is_mixed,
-            "sarcasm_detected": sarcasm_result.is_sarcastic,
-            "sarcasm_confidence": sarcasm_result.confidence,
-            "sarcasm_indicators": sarcasm_result.indicators,
-            "business_insight": insight,
-            "explanation": explanation,
-        }
+
+        results = []
+        for i, cleaned in enumerate(texts):
+            sentiment = sentiment_clf.classes_[sentiment_idx[i]]
+            emotion = emotion_clf.classes_[emotion_order[i, 0]]
+            sentiment_conf = float(sentiment_confs[i])
+            emotion_conf = float(emotion_confs[i])
+
+            # Get intensity levels
+            sentiment_intensity = get_intensity(sentiment_conf)
+            emotion_intensity = get_intensity(emotion_conf)
+
+            # Detect mixed emotions
+            secondary_emotion = None
+            secondary_conf = 0.0
+            if emotion_order.shape[1] > 1:
+                secondary_emotion = emotion_clf.classes_[emotion_order[i, 1]]
+                secondary_conf = emotion_probs[i, emotion_order[i, 1]]
+            is_mixed = bool(secondary_emotion and (emotion_conf - secondary_conf) < MIXED_EMOTION_THRESHOLD)
+
+            # SARCASM DETECTION
+            sarcasm_result = sarcasm_detector.detect(
+                text=cleaned,
+                sentiment=sentiment,
+                emotion=emotion
+            )
+
+            # If sarcasm detected with high confidence, re-interpret sentiment
+            original_sentiment = sentiment
+            if sarcasm_result.is_sarcastic and sarcasm_result.confidence > 0.7:
+                # Sarcasm often flips positive to negative
+                if sentiment == "positive":
+                    # Check if we should override based on emotion
+                    if emotion in SARCASM_PRIORITY_EMOTIONS:
+                        sentiment = "negative"
+
+            # Get business insight
+            insight = get_business_insight(emotion)
+
+            # Token attributions reuse the chunk's vectors instead of re-transforming
+            tokens_sentiment = _top_tokens(
+                sentiment_vectors[i], sentiment_clf.coef_[sentiment_idx[i]], sentiment_features, top_n=3
+            )
+            tokens_emotion = _top_tokens(
+                emotion_vectors[i], emotion_clf.coef_[emotion_order[i, 0]], emotion_features, top_n=3
+            )
+
+            # Generate natural language explanation (with sarcasm context)
+            explanation = generate_explanation(
+                text=cleaned,
+                sentiment=sentiment,
+                emotion=emotion,
+                sentiment_conf=sentiment_conf,
+                emotion_conf=emotion_conf,
+                tokens_sentiment=tokens_sentiment,
+                tokens_emotion=tokens_emotion,
+                sarcasm_result=sarcasm_result,
+                original_sentiment=original_sentiment if sentiment != original_sentiment else None,
+            )
+
+            results.append({
+                "sentiment": sentiment,
+                "sentiment_confidence": sentiment_conf,
+                "sentiment_intensity": sentiment_intensity,
+                "emotion": emotion,
+                "emotion_confidence": emotion_conf,
+                "emotion_intensity": emotion_intensity,
+                "secondary_emotion": secondary_emotion if is_mixed else None,
+                "secondary_confidence": float(secondary_conf) if is_mixed else None,
+                "is_mixed_emotion": is_mixed,
+                "sarcasm_detected": sarcasm_result.is_sarcastic,
+                "sarcasm_confidence": sarcasm_result.confidence,
+                "sarcasm_indicators": list(sarcasm_result.indicators),
+                "business_insight": insight,
+                "explanation": explanation,
+            })
+        return results
 
     def explain(self, text: str, task: str = "sentiment", top_n: int = 6) -> List[Tuple[str, float]]:
         pipeline = self.sentiment_model if task == "sentiment" else self.emotion_model
@@ -214,24 +278,80 @@ class SentimentEmotionModel:
         sentiment_path = model_dir / "sentiment_model.joblib"
         emotion_path = model_dir / "emotion_model.joblib"
         artifacts = ModelArtifacts.load(sentiment_path, emotion_path)
+        _attach_lookups(artifacts.sentiment_model)
+        _attach_lookups(artifacts.emotion_model)
         return cls(artifacts=artifacts)
 
 
+def _call_steps(pipeline: Pipeline, method: str, texts: List[str]) -> np.ndarray:
+    """Run the vectorizer and classifier directly, skipping Pipeline's per-call step dispatch."""
+    features = pipeline.named_steps["tfidf"].transform(texts)
+    return getattr(pipeline.named_steps["clf"], method)(features)
+
+
+def _transform_and_score(pipeline: Pipeline, texts: List[str]) -> Tuple[Any, np.ndarray]:
+    """TF-IDF matrix and class probabilities for ``texts`` from a single transform."""
+    features = pipeline.named_steps["tfidf"].transform(texts)
+    return features, pipeline.named_steps["clf"].predict_proba(features)
+
+
+def _labels_and_proba(pipeline: Pipeline, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Predicted labels (argmax of the probabilities) and the probabilities themselves."""
+    _, probs = _transform_and_score(pipeline, texts)
+    return pipeline.named_steps["clf"].classes_[probs.argmax(axis=1)], probs
+
+
+def _attach_lookups(pipeline: Pipeline) -> None:
+    """Cache feature names and a class -> row index map for a fitted pipeline."""
+    _LOOKUPS[pipeline] = (
+        pipeline.named_steps["tfidf"].get_feature_names_out(),
+        {label: idx for idx, label in enumerate(pipeline.named_steps["clf"].classes_)},
+    )
+
+
+def _lookups(pipeline: Pipeline) -> Tuple[np.ndarray, Dict[str, int]]:
+    """Feature names and class index for a pipeline, built on first use."""
+    if pipeline not in _LOOKUPS:
+        _attach_lookups(pipeline)
+    return _LOOKUPS[pipeline]
+
+
 def explain_with_coefficients(text: str, pipeline: Pipeline, top_n: int = 6) -> List[Tuple[str, float]]:
     """Return token-level importance using linear model coefficients."""
     vectorizer: TfidfVectorizer = pipeline.named_steps["tfidf"]
     classifier: LogisticRegression = pipeline.named_steps["clf"]
 
     vector = vectorizer.transform([text])
-    feature_names = vectorizer.get_feature_names_out()
+    feature_names, class_ids = _lookups(pipeline)
     class_index = classifier.predict(vector)[0]
-    class_id = list(classifier.classes_).index(class_index)
+    class_id = class_ids[class_index]
     coef = classifier.coef_[class_id]
+    return _top_tokens(vector, coef, feature_names, top_n=top_n)
+
+
+def _top_two(probs: np.ndarray) -> np.ndarray:
+    """
+    Column indices of the two most probable classes per row, best first.
+
+    A partial sort (argpartition) instead of a full argsort; ties within the pair
+    resolve to the lower class index, as a stable sort would.
+    """
+    if probs.shape[1] < 2:
+        return np.zeros((probs.shape[0], probs.shape[1]), dtype=np.intp)
+    top = np.argpartition(-probs, 1, axis=1)[:, :2]
+    rows = np.arange(probs.shape[0])
+    swap = (probs[rows, top[:, 0]] == probs[rows, top[:, 1]]) & (top[:, 0] > top[:, 1])
+    top[swap] = top[swap][:, ::-1]
+    return top
+
 
-    indices = vector.nonzero()[1]
-    scores = [(feature_names[idx], coef[idx] * vector[0, idx]) for idx in indices]
-    scores = sorted(scores, key=lambda pair: abs(pair[1]), reverse=True)
-    return scores[:top_n]
+def _top_tokens(vector, coef: np.ndarray, feature_names: np.ndarray, top_n: int) -> List[Tuple[str, float]]:
+    """Rank the non-zero features of a single TF-IDF row by |coefficient * weight|."""
+    indices = vector.indices
+    scores = coef[indices] * vector.data
+    # Stable sort keeps feature order for ties, matching sorted(..., reverse=True)
+    order = np.argsort(-np.abs(scores), kind="stable")[:top_n]
+    return [(feature_names[indices[i]], scores[i]) for i in order]
 
 
 def generate_explanation(
@@ -270,8 +390,10 @@ def generate_explanation(
     text_lower = text.lower()
     matched_keywords = []
     if emotion in EMOTION_KEYWORDS:
+        # Single linear scan for all keywords; report them in config order
+        found = set(scan_keywords(text_lower).get(emotion, ()))
         for keyword in EMOTION_KEYWORDS[emotion]:
-            if keyword in text_lower:
+            if keyword in found:
                 matched_keywords.append(f"'{keyword}'")
     
     # Build explanation
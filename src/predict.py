@@ -8,7 +8,7 @@ from typing import Iterable, List
 import pandas as pd
 
 from .model import SentimentEmotionModel
-from .preprocessing import ensure_nltk_resources, preprocess_text
+from .preprocessing import preprocess_series
 
 DEFAULT_MODELS = Path("models/saved_model")
 DEFAULT_OUTPUT = Path("data/processed/predictions.csv")
@@ -23,7 +23,7 @@ def load_texts(file_path: Path | None, text: str | None) -> List[str]:
         raise FileNotFoundError(f"Input file not found: {file_path}")
 
     if file_path.suffix.lower() == ".csv":
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, usecols=lambda column: column == "text", dtype=str)
         if "text" not in df.columns:
             raise ValueError("CSV must have a 'text' column for predictions.")
         return df["text"].astype(str).tolist()
@@ -39,37 +39,24 @@ def predict(
     output_path: Path,
 ) -> pd.DataFrame:
     model = SentimentEmotionModel.load(model_dir)
-    ensure_nltk_resources()
-
-    cleaned = [preprocess_text(t) for t in texts]
-    preds = model.predict(cleaned)
-    probs = model.predict_proba(cleaned)
-
-    sentiment_classes = list(model.sentiment_model.named_steps["clf"].classes_)
-    emotion_classes = list(model.emotion_model.named_steps["clf"].classes_)
-
-    rows = []
-    for idx, text in enumerate(texts):
-        sentiment = preds["sentiment"][idx]
-        emotion = preds["emotion"][idx]
-
-        sentiment_prob = probs["sentiment"][idx]
-        emotion_prob = probs["emotion"][idx]
-        sentiment_conf = float(sentiment_prob[sentiment_classes.index(sentiment)])
-        emotion_conf = float(emotion_prob[emotion_classes.index(emotion)])
-
-        rows.append(
-            {
-                "text": text,
-                "clean_text": cleaned[idx],
-                "sentiment": sentiment,
-                "sentiment_confidence": round(sentiment_conf, 4),
-                "emotion": emotion,
-                "emotion_confidence": round(emotion_conf, 4),
-            }
-        )
-
-    df_out = pd.DataFrame(rows)
+
+    texts = list(texts)
+    cleaned = preprocess_series(texts)
+
+    # One TF-IDF transform per task yields both labels and probabilities
+    preds, probs = model.predict_all(cleaned)
+
+    # Labels are the argmax class, so their confidence is the row maximum
+    df_out = pd.DataFrame(
+        {
+            "text": texts,
+            "clean_text": cleaned,
+            "sentiment": preds["sentiment"],
+            "sentiment_confidence": probs["sentiment"].max(axis=1).round(4),
+            "emotion": preds["emotion"],
+            "emotion_confidence": probs["emotion"].max(axis=1).round(4),
+        }
+    )
     output_path.parent.mkdir(parents=True, exist_ok=True)
     df_out.to_csv(output_path, index=False)
     return df_out
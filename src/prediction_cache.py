@@ -0,0 +1,149 @@
+"""SQLite-backed cache of per-text model predictions."""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Bump when cached prediction dicts change shape or meaning in ways the
+# source hash below cannot see (e.g. a dependency upgrade)
+CACHE_VERSION = 2
+
+# Modules whose code or tables shape predict_with_details output: rules,
+# thresholds, cue lists, explanation text and business insights
+_RULE_MODULES = ("config.py", "model.py", "sarcasm_detector.py")
+
+# Rows kept before the least recently used entries are evicted
+DEFAULT_MAX_ROWS = 100_000
+
+# SQLite caps bound parameters per statement; stay well below the limit
+_MAX_PARAMS = 500
+
+
+def rules_fingerprint() -> str:
+    """Hash of the source of the modules that produce cached predictions."""
+    digest = hashlib.blake2b(digest_size=8)
+    src_dir = Path(__file__).resolve().parent
+    for name in _RULE_MODULES:
+        digest.update((src_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def model_fingerprint(model_dir: Path) -> str:
+    """
+    Identify a saved model together with the prediction code that wraps it.
+
+    Retraining (artifact sizes and mtimes), editing rules or config, or bumping
+    CACHE_VERSION all yield a new fingerprint and so invalidate the cache.
+    """
+    parts = [f"v{CACHE_VERSION}", f"rules:{rules_fingerprint()}"]
+    for name in ("sentiment_model.joblib", "emotion_model.joblib"):
+        stat = (model_dir / name).stat()
+        parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return "|".join(parts)
+
+
+class PredictionCache:
+    """
+    Maps a hash of (model namespace, cleaned text) to the prediction dict.
+
+    A new connection is opened per operation, so one instance can be shared
+    across Streamlit sessions and threads. The table holds at most
+    ``max_rows`` entries; the least recently used ones are evicted first.
+    """
+
+    def __init__(self, db_path: Path, namespace: str = "", max_rows: int = DEFAULT_MAX_ROWS) -> None:
+        """
+        Args:
+            db_path: SQLite database file (created if missing)
+            namespace: Model identifier mixed into every key, e.g. model_fingerprint()
+            max_rows: Upper bound on stored predictions
+        """
+        self.db_path = Path(db_path)
+        self.namespace = namespace.encode("utf-8")
+        self.max_rows = max_rows
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(predictions)")}
+            if columns and "last_used" not in columns:
+                # Table from before LRU eviction; the cache is disposable
+                conn.execute("DROP TABLE predictions")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS predictions "
+                "(hash BLOB PRIMARY KEY, result_json BLOB NOT NULL, last_used INTEGER NOT NULL) "
+                "WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS predictions_last_used ON predictions (last_used)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def key(self, text: str) -> bytes:
+        """16-byte digest identifying ``text`` under this cache's namespace."""
+        digest = hashlib.blake2b(self.namespace, digest_size=16)
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def get(self, text: str) -> Optional[Dict]:
+        """Cached prediction for ``text``, or None."""
+        return self.get_many([text]).get(text)
+
+    def put(self, text: str, result: Dict) -> None:
+        """Store the prediction for ``text`` (existing entries are kept)."""
+        self.put_many([(text, result)])
+
+    def get_many(self, texts: Sequence[str]) -> Dict[str, Dict]:
+        """Cached predictions for the given texts; texts without an entry are omitted."""
+        keys = {self.key(text): text for text in texts}
+        found: Dict[str, Dict] = {}
+        hits: List[bytes] = []
+        hashes = list(keys)
+        with closing(self._connect()) as conn, conn:
+            for start in range(0, len(hashes), _MAX_PARAMS):
+                chunk = hashes[start:start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT hash, result_json FROM predictions WHERE hash IN ({placeholders})",
+                    chunk,
+                )
+                for digest, payload in rows:
+                    found[keys[digest]] = json.loads(payload)
+                    hits.append(digest)
+            # Refresh recency so frequently seen texts survive eviction
+            now = time.time_ns()
+            conn.executemany(
+                "UPDATE predictions SET last_used = ? WHERE hash = ?", [(now, digest) for digest in hits]
+            )
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, Dict]]) -> None:
+        """Store several predictions in one transaction, evicting old entries past ``max_rows``."""
+        now = time.time_ns()
+        rows: List[Tuple[bytes, str, int]] = [
+            (self.key(text), json.dumps(result), now) for text, result in items
+        ]
+        if not rows:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO predictions (hash, result_json, last_used) VALUES (?, ?, ?)",
+                rows,
+            )
+            excess = conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0] - self.max_rows
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM predictions WHERE hash IN "
+                    "(SELECT hash FROM predictions ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
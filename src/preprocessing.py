@@ -1,11 +1,13 @@
 """Text cleaning and preprocessing utilities for customer emotion analysis."""
 import re
 import string
+from functools import lru_cache
 from typing import Iterable, List
 
 import nltk
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 
 # Regex patterns for cleaning
 URL_PATTERN = re.compile(r"https?://\S+|www\.\S+")
@@ -20,13 +22,20 @@ EMOJI_PATTERN = re.compile(
     flags=re.UNICODE,
 )
 
+# HTML tags, URLs and emojis in one alternation for a single scan.
+# Tags are replaced by a space, URLs and emojis are dropped.
+_NOISE = re.compile(
+    f"(?P<html>{HTML_PATTERN.pattern})|{URL_PATTERN.pattern}|{EMOJI_PATTERN.pattern}",
+    flags=re.UNICODE,
+)
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+_WS = re.compile(r"\s+")
+# clean_text has already removed ASCII punctuation, so word runs are the tokens
+_WORD_RE = re.compile(r"\w+")
+
 
 def ensure_nltk_resources() -> None:
     """Download required NLTK resources if they are missing."""
-    try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt")
     try:
         nltk.data.find("corpora/stopwords")
     except LookupError:
@@ -46,44 +55,99 @@ def strip_emojis(text: str) -> str:
 
 
 def strip_punctuation(text: str) -> str:
-    return text.translate(str.maketrans("", "", string.punctuation))
+    return text.translate(_PUNCT_TABLE)
 
 
 def normalize_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS.sub(" ", text).strip()
+
+
+def _noise_replacement(match: re.Match) -> str:
+    return " " if match.group("html") else ""
 
 
 def clean_text(text: str) -> str:
     """Lowercase and remove noise such as URLs, HTML, emojis, and punctuation."""
     if not isinstance(text, str):
         return ""
-    lowered = text.lower()
-    lowered = strip_urls(lowered)
-    lowered = strip_html(lowered)
-    lowered = strip_emojis(lowered)
-    lowered = strip_punctuation(lowered)
-    lowered = normalize_whitespace(lowered)
-    return lowered
+    # One regex scan for URLs/HTML/emojis, then punctuation and whitespace
+    lowered = _NOISE.sub(_noise_replacement, text.lower()).translate(_PUNCT_TABLE)
+    return _WS.sub(" ", lowered).strip()
 
 
 def tokenize(text: str) -> List[str]:
-    return word_tokenize(text)
+    return _WORD_RE.findall(text)
+
+
+@lru_cache(maxsize=None)
+def _stopword_set() -> frozenset:
+    """English stopwords, read from the NLTK corpus once per process."""
+    return frozenset(stopwords.words("english"))
 
 
 def remove_stopwords(tokens: Iterable[str]) -> List[str]:
-    stop_words = set(stopwords.words("english"))
+    stop_words = _stopword_set()
     return [tok for tok in tokens if tok not in stop_words]
 
 
 def preprocess_text(text: str) -> str:
     """Full preprocessing pipeline returning a cleaned string."""
+    if not isinstance(text, str):
+        return ""
+    return _preprocess_cached(text)
+
+
+@lru_cache(maxsize=65536)
+def _preprocess_cached(text: str) -> str:
+    """Memoized body of preprocess_text; repeated feedback skips re-tokenizing."""
     cleaned = clean_text(text)
     tokens = tokenize(cleaned)
     tokens = remove_stopwords(tokens)
     return " ".join(tokens)
 
 
-def preprocess_series(texts: Iterable[str]) -> List[str]:
-    """Apply preprocessing to an iterable of texts."""
+def _strip_noise_series(texts: Iterable[str]) -> pd.Series:
+    """Lowercase a column and drop URLs, HTML, emojis and punctuation; non-strings become NaN."""
+    # Object dtype keeps Python's re semantics (pyarrow strings would use RE2)
+    series = pd.Series([t if isinstance(t, str) else None for t in texts], dtype=object)
+    return (
+        series.str.lower()
+        .str.replace(_NOISE, _noise_replacement, regex=True)
+        .str.translate(_PUNCT_TABLE)
+    )
+
+
+# Column-wise preprocessing runs at roughly 10 µs per text, while starting a
+# worker process costs on the order of a second: only split very large inputs
+MIN_TEXTS_PER_JOB = 200_000
+
+
+def preprocess_series(texts: Iterable[str], n_jobs: int = 1) -> List[str]:
+    """
+    Apply preprocessing to an iterable of texts.
+
+    Args:
+        texts: Raw texts
+        n_jobs: Worker processes for large inputs (-1 for all cores); each
+            worker cleans one contiguous chunk
+    """
     ensure_nltk_resources()
-    return [preprocess_text(t) for t in texts]
+    texts = list(texts)
+    n_workers = min(effective_n_jobs(n_jobs), len(texts) // MIN_TEXTS_PER_JOB)
+    if n_workers <= 1:
+        return _preprocess_chunk(texts)
+    chunk_size = -(-len(texts) // n_workers)
+    chunks = Parallel(n_jobs=n_workers, prefer="processes")(
+        delayed(_preprocess_chunk)(texts[start:start + chunk_size])
+        for start in range(0, len(texts), chunk_size)
+    )
+    return [cleaned for chunk in chunks for cleaned in chunk]
+
+
+def _preprocess_chunk(texts: List[str]) -> List[str]:
+    """Column-wise preprocessing of one chunk of texts."""
+    # Tokens are word runs, so whitespace normalisation can be skipped here
+    tokens = _strip_noise_series(texts).fillna("").str.findall(_WORD_RE)
+    # Inline filter with a local binding: no per-row call into remove_stopwords
+    stop_words = _stopword_set()
+    return [" ".join([tok for tok in row if tok not in stop_words]) for row in tokens]
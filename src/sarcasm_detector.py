@@ -9,16 +9,43 @@ for final-year projects, focusing on explainability and clarity.
 """
 
 import re
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+
+from .config import (
+    SARCASTIC_PHRASES,
+    SARCASM_NEGATIVE_CONTEXT,
+    SARCASM_POSITIVE_SURFACE,
+    SARCASTIC_INTENSIFIERS,
+    SARCASM_CACHE_SIZE,
+    MIN_SARCASM_LEN,
+    POSITIVE_SURFACE_LABEL,
+    NEGATIVE_CONTEXT_LABEL,
+    INTENSIFIER_LABEL,
+    SARCASTIC_PHRASE_LABEL,
+    scan_keyword_spans,
+)
 
 
 @dataclass
+class _CueScan:
+    """Everything the rule checks need from one scan of the lowercased text."""
+    phrases: Set[str] = field(default_factory=set)
+    positive_hits: Set[str] = field(default_factory=set)
+    negative_hits: Set[str] = field(default_factory=set)
+    positive_starts: Dict[int, List[str]] = field(default_factory=dict)
+    intensifier_ends: List[Tuple[int, str]] = field(default_factory=list)
+    punctuation_runs: List[str] = field(default_factory=list)
+    quoted_words: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
 class SarcasmResult:
-    """Container for sarcasm detection results."""
+    """Container for sarcasm detection results (immutable, so cached results can be shared)."""
     is_sarcastic: bool
     confidence: float
-    indicators: List[str]  # List of detected sarcasm indicators
+    indicators: Tuple[str, ...]  # Detected sarcasm indicators
     explanation: str
     
 
@@ -34,54 +61,24 @@ class SarcasmDetector:
     5. Sentiment-emotion polarity mismatch
     """
     
-    # Known sarcastic phrases and expressions
-    SARCASTIC_PHRASES = [
-        r"great job",
-        r"well done",
-        r"thanks a lot",
-        r"oh wonderful",
-        r"oh great",
-        r"just wonderful",
-        r"just perfect",
-        r"brilliant idea",
-        r"genius",
-        r"fantastic",
-        r"amazing work",
-        r"real smart",
-        r"very helpful",
-        r"so helpful",
-        r"love it when",
-        r"really appreciate",
-        r"couldn't be better",
-    ]
-    
-    # Negative context indicators (words that suggest complaint/problem)
-    NEGATIVE_CONTEXT = [
-        "terrible", "awful", "horrible", "worst", "useless", "broken", "failed",
-        "disaster", "nightmare", "unacceptable", "ridiculous", "pathetic",
-        "waste", "never", "disappointed", "frustrated", "angry", "furious",
-        "can't believe", "seriously", "joke", "kidding"
-    ]
-    
-    # Positive surface words (might be used sarcastically)
-    POSITIVE_SURFACE = [
-        "great", "wonderful", "excellent", "perfect", "amazing", "fantastic",
-        "brilliant", "awesome", "outstanding", "superb", "lovely", "nice",
-        "thanks", "thank", "appreciate", "love", "enjoy"
-    ]
-    
-    # Intensifiers that might indicate sarcasm when combined with positive words
-    SARCASTIC_INTENSIFIERS = [
-        "really", "so", "very", "such", "totally", "absolutely", "definitely",
-        "surely", "clearly", "obviously", "just"
-    ]
+    # Cue lists live in config so the shared keyword automaton can index them
+    SARCASTIC_PHRASES = SARCASTIC_PHRASES
+    NEGATIVE_CONTEXT = SARCASM_NEGATIVE_CONTEXT
+    POSITIVE_SURFACE = SARCASM_POSITIVE_SURFACE
+    POSITIVE_SURFACE_SET = frozenset(SARCASM_POSITIVE_SURFACE)
+    SARCASTIC_INTENSIFIERS = SARCASTIC_INTENSIFIERS
+    MIN_SARCASM_LEN = MIN_SARCASM_LEN
+    # List positions, so "first in list order" is a min() over found pairs
+    _INTENSIFIER_RANK = {word: i for i, word in reversed(list(enumerate(SARCASTIC_INTENSIFIERS)))}
+    _POSITIVE_RANK = {word: i for i, word in reversed(list(enumerate(SARCASM_POSITIVE_SURFACE)))}
     
     def __init__(self):
         """Initialize the sarcasm detector with compiled patterns."""
-        self.sarcastic_phrase_patterns = [
-            re.compile(r'\b' + phrase + r'\b', re.IGNORECASE) 
-            for phrase in self.SARCASTIC_PHRASES
-        ]
+        # Runs of '!'/'?' and quoted words never share characters, so one
+        # alternation finds both; group 1 is set only for quoted words
+        self.marks_pattern = re.compile(r'[!?]{2,}|["\'](\w+)["\']')
+        # Feedback streams repeat texts; results are pure functions of the arguments
+        self._cached_detect = lru_cache(maxsize=SARCASM_CACHE_SIZE)(self._detect_impl)
     
     def detect(self, text: str, sentiment: str = None, emotion: str = None) -> SarcasmResult:
         """
@@ -95,30 +92,44 @@ class SarcasmDetector:
         Returns:
             SarcasmResult object with detection results
         """
+        return self._cached_detect(text, sentiment, emotion)
+    
+    def _detect_impl(self, text: str, sentiment: Optional[str], emotion: Optional[str]) -> SarcasmResult:
+        """Uncached body of detect()."""
+        # Too little text to carry sarcasm; skip every scanner
+        if len(text) < self.MIN_SARCASM_LEN:
+            return SarcasmResult(
+                is_sarcastic=False,
+                confidence=0.0,
+                indicators=(),
+                explanation="No sarcasm detected. Text is too short to analyze."
+            )
+        
         text_lower = text.lower()
+        scan = self._scan_all(text_lower)
         indicators = []
         confidence_scores = []
         
         # 1. Check for known sarcastic phrases
-        phrase_score, phrase_indicators = self._detect_sarcastic_phrases(text_lower)
+        phrase_score, phrase_indicators = self._detect_sarcastic_phrases(scan)
         if phrase_score > 0:
             confidence_scores.append(phrase_score)
             indicators.extend(phrase_indicators)
         
         # 2. Check for contrast (positive words + negative context)
-        contrast_score, contrast_indicators = self._detect_contrast(text_lower)
+        contrast_score, contrast_indicators = self._detect_contrast(text_lower, scan)
         if contrast_score > 0:
             confidence_scores.append(contrast_score)
             indicators.extend(contrast_indicators)
         
         # 3. Check for excessive punctuation
-        punct_score, punct_indicators = self._detect_excessive_punctuation(text)
+        punct_score, punct_indicators = self._detect_excessive_punctuation(scan)
         if punct_score > 0:
             confidence_scores.append(punct_score)
             indicators.extend(punct_indicators)
         
         # 4. Check for quoted positive words (e.g., "great" service)
-        quote_score, quote_indicators = self._detect_quoted_positives(text)
+        quote_score, quote_indicators = self._detect_quoted_positives(scan)
         if quote_score > 0:
             confidence_scores.append(quote_score)
             indicators.extend(quote_indicators)
@@ -149,48 +160,72 @@ class SarcasmDetector:
         return SarcasmResult(
             is_sarcastic=is_sarcastic,
             confidence=final_confidence,
-            indicators=indicators,
+            indicators=tuple(indicators),
             explanation=explanation
         )
     
-    def _detect_sarcastic_phrases(self, text_lower: str) -> Tuple[float, List[str]]:
+    def _scan_all(self, text_lower: str) -> _CueScan:
+        """
+        Collect every cue in two passes over the text: one keyword automaton
+        pass for phrases and cue words, one regex pass for punctuation and quotes.
+        """
+        scan = _CueScan()
+        # Whole-word hits from the shared automaton, which also reports overlaps
+        for start, end, word, labels in scan_keyword_spans(text_lower, whole_words=True):
+            if SARCASTIC_PHRASE_LABEL in labels:
+                scan.phrases.add(word)
+            if POSITIVE_SURFACE_LABEL in labels:
+                scan.positive_hits.add(word)
+                scan.positive_starts.setdefault(start, []).append(word)
+            if NEGATIVE_CONTEXT_LABEL in labels:
+                scan.negative_hits.add(word)
+            if INTENSIFIER_LABEL in labels:
+                scan.intensifier_ends.append((end, word))
+        
+        # Lowercasing never adds or removes '!', '?' or quotes
+        for match in self.marks_pattern.finditer(text_lower):
+            if match.group(1) is None:
+                scan.punctuation_runs.append(match.group())
+            else:
+                scan.quoted_words.append(match.group(1))
+        return scan
+    
+    def _detect_sarcastic_phrases(self, scan: _CueScan) -> Tuple[float, List[str]]:
         """Detect known sarcastic expressions."""
-        indicators = []
-        for pattern in self.sarcastic_phrase_patterns:
-            match = pattern.search(text_lower)
-            if match:
-                indicators.append(f"sarcastic phrase: '{match.group()}'")
+        # Indicators follow the phrase list order
+        indicators = [
+            f"sarcastic phrase: '{phrase}'" for phrase in self.SARCASTIC_PHRASES if phrase in scan.phrases
+        ]
         
         if indicators:
             # Higher confidence for explicit sarcastic phrases
             return 0.75, indicators
         return 0.0, []
     
-    def _detect_contrast(self, text_lower: str) -> Tuple[float, List[str]]:
+    def _detect_contrast(self, text_lower: str, scan: _CueScan) -> Tuple[float, List[str]]:
         """
         Detect contrast between positive surface words and negative context.
         Classic sarcasm pattern: positive words in negative situations.
         """
-        positive_found = []
-        negative_found = []
-        
-        # Find positive words
-        for word in self.POSITIVE_SURFACE:
-            if re.search(r'\b' + word + r'\b', text_lower):
-                positive_found.append(word)
-        
-        # Find negative context
-        for word in self.NEGATIVE_CONTEXT:
-            if re.search(r'\b' + word + r'\b', text_lower):
-                negative_found.append(word)
+        # Find positive words and negative context, in list order
+        positive_found = [word for word in self.POSITIVE_SURFACE if word in scan.positive_hits]
+        negative_found = [word for word in self.NEGATIVE_CONTEXT if word in scan.negative_hits]
         
-        # Check for intensifier + positive (e.g., "so helpful")
-        intensified_positives = []
-        for intensifier in self.SARCASTIC_INTENSIFIERS:
-            for positive in self.POSITIVE_SURFACE:
-                pattern = r'\b' + intensifier + r'\s+' + positive + r'\b'
-                if re.search(pattern, text_lower):
-                    intensified_positives.append(f"{intensifier} {positive}")
+        # Check for intensifier + positive (e.g., "so helpful"): a positive word
+        # must start right after the whitespace run that follows the intensifier
+        pairs = set()
+        for end, intensifier in scan.intensifier_ends:
+            gap_end = end
+            while gap_end < len(text_lower) and text_lower[gap_end].isspace():
+                gap_end += 1
+            if gap_end > end:
+                pairs.update((intensifier, positive) for positive in scan.positive_starts.get(gap_end, ()))
+        # Report the first pair in intensifier-then-positive list order
+        intensified_positive = None
+        if pairs:
+            intensified_positive = "{} {}".format(*min(
+                pairs, key=lambda pair: (self._INTENSIFIER_RANK[pair[0]], self._POSITIVE_RANK[pair[1]])
+            ))
         
         indicators = []
         score = 0.0
@@ -201,50 +236,53 @@ class SarcasmDetector:
             score = 0.7
         
         # Intensified positives are often sarcastic even without explicit negative words
-        if intensified_positives:
-            indicators.append(f"intensified positive: '{intensified_positives[0]}'")
+        if intensified_positive:
+            indicators.append(f"intensified positive: '{intensified_positive}'")
             score = max(score, 0.65)
         
         return score, indicators
     
-    def _detect_excessive_punctuation(self, text: str) -> Tuple[float, List[str]]:
+    def _detect_excessive_punctuation(self, scan: _CueScan) -> Tuple[float, List[str]]:
         """
         Detect excessive exclamation/question marks.
         Multiple punctuation marks often indicate sarcasm or exaggeration.
         """
+        # Every excessive pattern lives inside a run of '!'/'?'
+        has_exclamation = has_question = has_mixed = False
+        for run in scan.punctuation_runs:
+            has_exclamation = has_exclamation or '!!' in run
+            has_question = has_question or '??' in run
+            has_mixed = has_mixed or len(run) >= 3
+        
         indicators = []
         
         # Multiple exclamation marks
-        if re.search(r'!{2,}', text):
+        if has_exclamation:
             indicators.append("excessive exclamation marks")
         
         # Multiple question marks
-        if re.search(r'\?{2,}', text):
+        if has_question:
             indicators.append("excessive question marks")
         
         # Mixed punctuation
-        if re.search(r'[!?]{3,}', text):
+        if has_mixed:
             indicators.append("mixed excessive punctuation")
         
         if indicators:
             return 0.55, indicators
         return 0.0, []
     
-    def _detect_quoted_positives(self, text: str) -> Tuple[float, List[str]]:
+    def _detect_quoted_positives(self, scan: _CueScan) -> Tuple[float, List[str]]:
         """
         Detect positive words in quotation marks.
         Quotes around positive words often indicate sarcasm (e.g., "great" service).
         """
-        indicators = []
-        
-        # Check for quoted words
-        quoted_pattern = r'["\'](\w+)["\']'
-        matches = re.finditer(quoted_pattern, text.lower())
-        
-        for match in matches:
-            word = match.group(1)
-            if word in self.POSITIVE_SURFACE:
-                indicators.append(f"quoted positive word: '{word}'")
+        positive_set = self.POSITIVE_SURFACE_SET
+        indicators = [
+            f"quoted positive word: '{word}'"
+            for word in scan.quoted_words
+            if word in positive_set
+        ]
         
         if indicators:
             return 0.7, indicators
@@ -288,12 +326,9 @@ class SarcasmDetector:
         return " ".join(explanation_parts)
 
 
-# Singleton instance for easy import
-_detector_instance = None
+# Singleton instance for easy import; construction only compiles one regex
+_detector_instance = SarcasmDetector()
 
 def get_sarcasm_detector() -> SarcasmDetector:
-    """Get or create the singleton sarcasm detector instance."""
-    global _detector_instance
-    if _detector_instance is None:
-        _detector_instance = SarcasmDetector()
+    """Get the shared sarcasm detector instance."""
     return _detector_instance
@@ -4,13 +4,14 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedShuffleSplit
 from sklearn.metrics import classification_report
 
-from .preprocessing import ensure_nltk_resources, preprocess_series
+from .preprocessing import MIN_TEXTS_PER_JOB, ensure_nltk_resources, preprocess_series
 from .model import SentimentEmotionModel
 
 
@@ -31,23 +32,46 @@ def load_dataset(data_path: Path) -> pd.DataFrame:
     return df
 
 
-def preprocess_dataset(df: pd.DataFrame) -> pd.DataFrame:
+def preprocess_dataset(df: pd.DataFrame, n_jobs: int = -1) -> pd.DataFrame:
+    # Resources are fetched here, before any worker process starts
     ensure_nltk_resources()
     df = df.copy()
-    df["clean_text"] = preprocess_series(df["text"].fillna(""))
+    df["clean_text"] = preprocess_series(df["text"].fillna(""), n_jobs=n_jobs)
     return df
 
 
 def split_data(
     df: pd.DataFrame, test_size: float, val_size: float, seed: int
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    df_train, df_test = train_test_split(
-        df, test_size=test_size, random_state=seed, stratify=df["sentiment"]
+    """
+    Train/validation/test split stratified jointly on sentiment and emotion.
+
+    Splitting works on positions only; the DataFrame is indexed once per split.
+    """
+    labels = (df["sentiment"].astype(str) + "_" + df["emotion"].astype(str)).to_numpy()
+    sentiments = df["sentiment"].to_numpy()
+    positions = np.arange(len(df))
+    train_pos, test_pos = _stratified_split(positions, labels, sentiments, test_size, seed)
+    train_pos, val_pos = _stratified_split(
+        train_pos, labels[train_pos], sentiments[train_pos], val_size, seed
     )
-    df_train, df_val = train_test_split(
-        df_train, test_size=val_size, random_state=seed, stratify=df_train["sentiment"]
-    )
-    return df_train, df_val, df_test
+    return df.iloc[train_pos], df.iloc[val_pos], df.iloc[test_pos]
+
+
+def _stratified_split(
+    positions: np.ndarray,
+    labels: np.ndarray,
+    fallback_labels: np.ndarray,
+    test_size: float,
+    seed: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Split positions stratified on ``labels``, or on ``fallback_labels`` if a joint class is too rare."""
+    _, counts = np.unique(labels, return_counts=True)
+    if counts.min() < 2:
+        labels = fallback_labels
+    splitter = StratifiedShuffleSplit(n_splits=1, test_size=test_size, random_state=seed)
+    train_idx, test_idx = next(splitter.split(positions, labels))
+    return positions[train_idx], positions[test_idx]
 
 
 def train_models(df_train: pd.DataFrame) -> SentimentEmotionModel:
@@ -60,8 +84,21 @@ def train_models(df_train: pd.DataFrame) -> SentimentEmotionModel:
     return model
 
 
-def evaluate_models(model: SentimentEmotionModel, df_split: pd.DataFrame) -> dict:
-    predictions = model.predict(df_split["clean_text"])
+def evaluate_splits(model: SentimentEmotionModel, splits: Dict[str, pd.DataFrame]) -> dict:
+    """Evaluate several splits with one predict call over their concatenated texts."""
+    combined = pd.concat([df_split["clean_text"] for df_split in splits.values()], ignore_index=True)
+    predictions = model.predict(combined)
+    metrics = {}
+    start = 0
+    for name, df_split in splits.items():
+        end = start + len(df_split)
+        split_predictions = {task: labels[start:end] for task, labels in predictions.items()}
+        metrics[name] = _classification_reports(df_split, split_predictions)
+        start = end
+    return metrics
+
+
+def _classification_reports(df_split: pd.DataFrame, predictions: Dict) -> dict:
     sentiment_report = classification_report(
         df_split["sentiment"],
         predictions["sentiment"],
@@ -90,9 +127,11 @@ def save_artifacts(
     models_dir.mkdir(parents=True, exist_ok=True)
 
     model.save(models_dir)
-    (processed_dir / "train.csv").write_text(train_df.to_csv(index=False))
-    (processed_dir / "val.csv").write_text(val_df.to_csv(index=False))
-    (processed_dir / "test.csv").write_text(test_df.to_csv(index=False))
+    # Columnar, compressed and typed; much faster to write and reload than CSV
+    for name, split_df in (("train", train_df), ("val", val_df), ("test", test_df)):
+        split_df.to_parquet(
+            processed_dir / f"{name}.parquet", engine="pyarrow", compression="zstd", index=False
+        )
     with (processed_dir / "metrics.json").open("w", encoding="utf-8") as f:
         json.dump(metrics, f, indent=2)
 
@@ -103,7 +142,7 @@ def run(args: argparse.Namespace) -> None:
     models_dir = Path(args.models_dir)
 
     df = load_dataset(data_path)
-    df = preprocess_dataset(df)
+    df = preprocess_dataset(df, n_jobs=args.n_jobs)
     df_train, df_val, df_test = split_data(
         df, test_size=args.test_size, val_size=args.val_size, seed=args.seed
     )
@@ -118,10 +157,7 @@ def run(args: argparse.Namespace) -> None:
         model = train_models(df_train)
         print(f"   Training samples: {len(df_train)}")
     
-    metrics = {
-        "validation": evaluate_models(model, df_val),
-        "test": evaluate_models(model, df_test),
-    }
+    metrics = evaluate_splits(model, {"validation": df_val, "test": df_test})
 
     save_artifacts(model, metrics, processed_dir, models_dir, df_train, df_val, df_test)
 
@@ -155,6 +191,16 @@ def parse_args() -> argparse.Namespace:
         help="Validation split size applied on the training portion",
     )
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=-1,
+        help=(
+            "Worker processes for text preprocessing (-1 for all cores); only takes "
+            f"effect for datasets over {2 * MIN_TEXTS_PER_JOB:,} rows, smaller ones "
+            "are cleaned in-process"
+        ),
+    )
     parser.add_argument(
         "--use-val-for-training",
         action="store_true",
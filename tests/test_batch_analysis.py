@@ -0,0 +1,59 @@
+"""Tests for batch analysis summaries."""
+
+import sys
+from pathlib import Path
+
+# Make the src package importable
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.batch_analysis import BatchAnalyzer
+from src.config import get_business_insight
+
+
+def _prediction(sentiment, emotion):
+    return {
+        "text": f"{sentiment} {emotion} feedback",
+        "sentiment": sentiment,
+        "sentiment_confidence": 0.8,
+        "sentiment_intensity": "high",
+        "emotion": emotion,
+        "emotion_confidence": 0.8,
+        "emotion_intensity": "high",
+        "is_mixed_emotion": False,
+        "sarcasm_detected": False,
+        "sarcasm_confidence": 0.0,
+        "business_insight": get_business_insight(emotion),
+    }
+
+
+# Ties are resolved by first appearance, not alphabetically: "positive" and
+# "negative" are tied, and fear/frustration/annoyance/anger tie for third place
+TIED_BATCH = [
+    _prediction("positive", "surprise"),
+    _prediction("negative", "surprise"),
+    _prediction("positive", "fear"),
+    _prediction("negative", "frustration"),
+    _prediction("neutral", "annoyance"),
+    _prediction("positive", "anger"),
+    _prediction("negative", "surprise"),
+]
+
+
+def test_distributions_keep_first_appearance_order_on_ties():
+    analyzer = BatchAnalyzer(TIED_BATCH)
+
+    assert list(analyzer.sentiment_distribution()) == ["positive", "negative", "neutral"]
+    assert list(analyzer.emotion_distribution()) == [
+        "surprise", "fear", "frustration", "annoyance", "anger",
+    ]
+
+
+def test_summary_report_breaks_ties_by_first_appearance():
+    summary = BatchAnalyzer(TIED_BATCH).generate_summary_report()
+
+    assert summary["dominant_sentiment"] == "positive"
+    assert list(summary["top_3_emotions"]) == ["surprise", "fear", "frustration"]
+    assert summary["top_3_emotions"]["surprise"] == 3 / 7 * 100
+    assert summary["total_feedback"] == 7
@@ -0,0 +1,38 @@
+"""Tests for token highlighting."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the src package importable
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.explainability import highlight_tokens
+
+
+@pytest.mark.parametrize(
+    "text, token",
+    [
+        ("GREAT service", "great"),
+        ("STRAßE closed", "straße"),
+        ("KELVIN scale", "Kelvin"),  # Kelvin sign
+        ("ſuper fast", "super"),  # long s
+        ("ILIK weather", "ılık"),  # Turkish dotless i
+        ("İyi service", "iyi"),  # Turkish dotted capital I
+    ],
+)
+def test_case_insensitive_matches_are_highlighted(text, token):
+    html = highlight_tokens(text, [(token, 0.5)])
+
+    assert html.count("<span") == 1
+    assert text.split()[0] + "</span>" in html
+
+
+def test_longer_ngrams_win_and_keep_their_color():
+    html = highlight_tokens("Not Good at all, good?", [("good", 0.9), ("not good", -0.9)])
+
+    assert "rgba(231, 76, 60, 0.65); padding:2px 4px; border-radius:4px'>Not Good</span>" in html
+    assert "rgba(46, 204, 113, 0.65); padding:2px 4px; border-radius:4px'>good</span>" in html
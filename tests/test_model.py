@@ -0,0 +1,81 @@
+"""Tests for SentimentEmotionModel prediction and persistence."""
+
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+
+# Make the src package importable
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src import model as model_module
+from src.model import SentimentEmotionModel
+
+TRAIN = [
+    ("great service thank you", "positive", "gratitude"),
+    ("love the new features", "positive", "joy"),
+    ("really happy with quality", "positive", "satisfaction"),
+    ("terrible support never again", "negative", "anger"),
+    ("order broken and late", "negative", "frustration"),
+    ("sad the product failed", "negative", "sadness"),
+    ("how does this feature work", "neutral", "curiosity"),
+    ("the package arrived today", "neutral", "neutral"),
+    ("not sure what the update changed", "neutral", "confusion"),
+] * 3
+
+TEXTS = [
+    "great support thank you",
+    "terrible order never arrived",
+    "how does the update work",
+    "happy but the package was late",
+    "",
+] * 7
+
+
+@pytest.fixture(scope="module")
+def model():
+    texts, sentiments, emotions = zip(*TRAIN)
+    return SentimentEmotionModel().fit(list(texts), list(sentiments), list(emotions))
+
+
+def _outputs(model):
+    preds, probs = model.predict_all(TEXTS)
+    return model.predict(TEXTS), model.predict_proba(TEXTS), preds, probs
+
+
+def test_threaded_predictions_match_serial(model, monkeypatch):
+    serial = _outputs(model)
+
+    calls = []
+
+    class RecordingParallel(model_module.Parallel):
+        def __init__(self, *args, **kwargs):
+            calls.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    # Force the threaded branch of _run_pipelines for a small input
+    monkeypatch.setattr(model_module, "Parallel", RecordingParallel)
+    monkeypatch.setattr(model_module, "PARALLEL_PREDICT_MIN_TEXTS", 1)
+    threaded = _outputs(model)
+
+    assert [call["prefer"] for call in calls] == ["threads"] * 3
+    for serial_output, threaded_output in zip(serial, threaded):
+        # Same keys, and tasks are not swapped when results come back from the threads
+        assert list(threaded_output) == ["sentiment", "emotion"]
+        for task in ("sentiment", "emotion"):
+            np.testing.assert_array_equal(threaded_output[task], serial_output[task])
+    assert set(threaded[0]["sentiment"]) <= set(model.sentiment_model.classes_)
+    assert set(threaded[0]["emotion"]) <= set(model.emotion_model.classes_)
+
+
+def test_saved_pipelines_do_not_carry_lookups(model, tmp_path):
+    explanation = model.explain("great support thank you")
+    model.save(tmp_path)
+
+    for name in ("sentiment_model.joblib", "emotion_model.joblib"):
+        assert not hasattr(joblib.load(tmp_path / name), "_feature_names")
+    assert SentimentEmotionModel.load(tmp_path).explain("great support thank you") == explanation
@@ -0,0 +1,99 @@
+"""Tests for the SQLite prediction cache."""
+
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the src package importable
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src import prediction_cache
+from src.prediction_cache import PredictionCache, model_fingerprint
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing time_ns, so recency ordering is deterministic."""
+    ticks = itertools.count(1)
+    monkeypatch.setattr(prediction_cache.time, "time_ns", lambda: next(ticks))
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    directory = tmp_path / "model"
+    directory.mkdir()
+    for name in ("sentiment_model.joblib", "emotion_model.joblib"):
+        (directory / name).write_bytes(b"weights")
+    return directory
+
+
+def _result(i):
+    return {"sentiment": "positive", "sarcasm_indicators": [f"indicator {i}"], "score": i / 10}
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = PredictionCache(tmp_path / "cache.sqlite", namespace="m1")
+    assert cache.get("great service") is None
+
+    cache.put("great service", _result(1))
+    assert cache.get("great service") == _result(1)
+
+
+def test_put_many_keeps_existing_entries(tmp_path):
+    cache = PredictionCache(tmp_path / "cache.sqlite", namespace="m1")
+    cache.put_many([("a", _result(1)), ("b", _result(2))])
+    cache.put_many([("a", _result(9)), ("c", _result(3))])
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": _result(1), "b": _result(2), "c": _result(3)}
+    cache.put_many([])
+    assert len(cache) == 3
+
+
+def test_get_many_spans_parameter_chunks(tmp_path):
+    cache = PredictionCache(tmp_path / "cache.sqlite", namespace="m1")
+    texts = [f"text {i}" for i in range(2 * prediction_cache._MAX_PARAMS + 7)]
+    cache.put_many((text, _result(i)) for i, text in enumerate(texts) if i % 3)
+
+    found = cache.get_many(texts + ["missing"])
+    assert found == {text: _result(i) for i, text in enumerate(texts) if i % 3}
+
+
+def test_namespace_isolates_entries(tmp_path):
+    db_path = tmp_path / "cache.sqlite"
+    PredictionCache(db_path, namespace="old model").put("text", _result(1))
+
+    assert PredictionCache(db_path, namespace="new model").get("text") is None
+    assert PredictionCache(db_path, namespace="old model").get("text") == _result(1)
+
+
+def test_fingerprint_changes_with_model_and_version(model_dir, monkeypatch):
+    original = model_fingerprint(model_dir)
+    assert model_fingerprint(model_dir) == original
+
+    monkeypatch.setattr(prediction_cache, "CACHE_VERSION", prediction_cache.CACHE_VERSION + 1)
+    assert model_fingerprint(model_dir) != original
+    monkeypatch.undo()
+
+    (model_dir / "emotion_model.joblib").write_bytes(b"retrained weights")
+    assert model_fingerprint(model_dir) != original
+
+
+def test_fingerprint_changes_with_rule_sources(model_dir, monkeypatch):
+    original = model_fingerprint(model_dir)
+    monkeypatch.setattr(prediction_cache, "rules_fingerprint", lambda: "edited rules")
+    assert model_fingerprint(model_dir) != original
+
+
+def test_least_recently_used_rows_are_evicted(tmp_path, clock):
+    cache = PredictionCache(tmp_path / "cache.sqlite", namespace="m1", max_rows=2)
+    cache.put("a", _result(1))
+    cache.put("b", _result(2))
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("c", _result(3))
+
+    assert len(cache) == 2
+    assert cache.get_many(["a", "b", "c"]) == {"a": _result(1), "c": _result(3)}
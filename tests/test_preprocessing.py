@@ -0,0 +1,51 @@
+"""Tests for column-wise and multi-process text preprocessing."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the src package importable
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src import preprocessing
+from src.preprocessing import preprocess_series, preprocess_text
+
+TEXTS = [
+    "Great job breaking my order again!!",
+    "<p>Visit https://example.com for the   refund</p> 😀",
+    "The support team solved my issue within minutes",
+    "",
+    None,
+    "Don’t   ship_it until it's fixed...",
+] * 10
+
+
+@pytest.fixture
+def parallel_calls(monkeypatch):
+    """Record how preprocess_series fans out to joblib workers."""
+    calls = []
+
+    class RecordingParallel(preprocessing.Parallel):
+        def __init__(self, *args, **kwargs):
+            calls.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(preprocessing, "Parallel", RecordingParallel)
+    return calls
+
+
+def test_series_matches_single_text_pipeline(parallel_calls):
+    assert preprocess_series(TEXTS) == [preprocess_text(text) for text in TEXTS]
+    assert parallel_calls == []
+
+
+def test_multiple_workers_match_serial_output(monkeypatch, parallel_calls):
+    serial = preprocess_series(TEXTS)
+    # Lower the threshold so a small input is split across two processes
+    monkeypatch.setattr(preprocessing, "MIN_TEXTS_PER_JOB", 10)
+
+    assert preprocess_series(TEXTS, n_jobs=2) == serial
+    assert [call["n_jobs"] for call in parallel_calls] == [2]